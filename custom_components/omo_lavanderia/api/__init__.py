@@ -4,6 +4,7 @@ from .exceptions import OmoApiError, OmoAuthError
 from .models import (
     ActiveOrder,
     ActiveOrderMachine,
+    ActiveOrdersBundle,
     Laundry,
     LaundryMachine,
     MachineStatus,
@@ -17,6 +18,7 @@ __all__ = [
     "OmoAuthError",
     "ActiveOrder",
     "ActiveOrderMachine",
+    "ActiveOrdersBundle",
     "Laundry",
     "LaundryMachine",
     "MachineStatus",
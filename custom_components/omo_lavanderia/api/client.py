@@ -1,19 +1,37 @@
 """API client for Omo Lavanderia (Machine Guardian API)."""
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import logging
 import time
+from collections.abc import Mapping
 from typing import Any, Callable
 
 import aiohttp
-
-from ..const import API_BASE_URL, APP_OS_VERSION, APP_PLATFORM, APP_VERSION
+import orjson
+
+from ..const import (
+    API_BASE_URL,
+    APP_OS_VERSION,
+    APP_PLATFORM,
+    APP_VERSION,
+    MAX_CONCURRENT_REQUESTS,
+)
 from .exceptions import OmoApiError, OmoAuthError
-from .models import ActiveOrder, Laundry, LaundryMachine, PaymentCard
+from .models import (
+    ActiveOrder,
+    ActiveOrdersBundle,
+    Laundry,
+    LaundryMachine,
+    PaymentCard,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+# Returned by _request when a conditional request gets HTTP 304
+_NOT_MODIFIED: Any = object()
+
 
 class OmoLavanderiaApiClient:
     """Async API client for Omo Lavanderia service."""
@@ -35,6 +53,11 @@ class OmoLavanderiaApiClient:
         self._login_failures: int = 0
         self._device_id = self._generate_device_id(username)
         self._token_update_callback: Callable[[str, str, int], None] | None = None
+        # Bounds concurrent API calls so bursts of refreshes don't flood the host
+        self._request_semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        # Conditional request headers and last parsed result per endpoint
+        self._validators: dict[str, dict[str, str]] = {}
+        self._parsed_cache: dict[str, Any] = {}
 
     @staticmethod
     def _generate_device_id(username: str) -> str:
@@ -167,15 +190,23 @@ class OmoLavanderiaApiClient:
         params: dict[str, Any] | None = None,
         include_auth: bool = True,
         retry_on_401: bool = True,
-    ) -> dict[str, Any]:
-        """Make an HTTP request to the API."""
+        conditional: bool = False,
+    ) -> Any:
+        """Make an HTTP request to the API.
+
+        ETag/Last-Modified validators of GET responses are remembered. With
+        conditional=True they are sent back and _NOT_MODIFIED is returned on
+        HTTP 304.
+        """
         url = f"{API_BASE_URL}{endpoint}"
         headers = self._get_headers(include_auth)
+        if conditional and endpoint in self._validators:
+            headers.update(self._validators[endpoint])
 
         _LOGGER.debug("Making %s request to %s", method, url)
 
         try:
-            async with self._session.request(
+            async with self._request_semaphore, self._session.request(
                 method,
                 url,
                 headers=headers,
@@ -185,33 +216,20 @@ class OmoLavanderiaApiClient:
             ) as response:
                 response_text = await response.text()
 
-                _LOGGER.debug(
-                    "Response status: %s, body: %s",
-                    response.status,
-                    response_text[:500] if response_text else "empty",
-                )
-
-                if response.status == 401:
-                    if retry_on_401 and include_auth:
-                        _LOGGER.debug("Token expired (401), attempting refresh/login")
-                        await self.async_ensure_valid_token()
-                        return await self._request(
-                            method, endpoint, data, params, include_auth, False
-                        )
-                    raise OmoAuthError("Authentication failed - token invalid")
-
-                if response.status >= 400:
-                    raise OmoApiError(
-                        f"API error: {response_text}", status_code=response.status
+                # Skip slicing the body for every response unless debug is on
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug(
+                        "Response status: %s, body: %s",
+                        response.status,
+                        response_text[:500] if response_text else "empty",
                     )
 
-                if response_text:
-                    result = await response.json()
-                    # API wraps responses in "data" field
-                    if isinstance(result, dict) and "data" in result:
-                        return result["data"]
-                    return result
-                return {}
+                if response.status != 401:
+                    return await self._handle_response(
+                        method, endpoint, response, response_text, conditional
+                    )
+                if not (retry_on_401 and include_auth):
+                    raise OmoAuthError("Authentication failed - token invalid")
 
         except aiohttp.ClientError as err:
             _LOGGER.error("HTTP request failed: %s", err)
@@ -220,6 +238,80 @@ class OmoLavanderiaApiClient:
             _LOGGER.error("Request timeout: %s", err)
             raise OmoApiError(f"Request timeout: {err}") from err
 
+        # Got a 401: log in again and retry once. This runs after the semaphore
+        # is released so concurrent retries cannot wait on each other's slots.
+        _LOGGER.debug("Token expired (401), attempting refresh/login")
+        await self.async_ensure_valid_token()
+        return await self._request(
+            method, endpoint, data, params, include_auth, False, conditional
+        )
+
+    async def _handle_response(
+        self,
+        method: str,
+        endpoint: str,
+        response: aiohttp.ClientResponse,
+        response_text: str,
+        conditional: bool,
+    ) -> Any:
+        """Turn a non-401 HTTP response into the API payload."""
+        if response.status == 304 and conditional:
+            return _NOT_MODIFIED
+
+        if response.status >= 400:
+            raise OmoApiError(
+                f"API error: {response_text}", status_code=response.status
+            )
+
+        result: Any = {}
+        if response_text:
+            # The body was already read as text, decode it directly
+            try:
+                result = orjson.loads(response_text)
+            except orjson.JSONDecodeError as err:
+                raise OmoApiError(f"Invalid JSON response: {err}") from err
+            # API wraps responses in "data" field
+            if isinstance(result, dict) and "data" in result:
+                result = result["data"]
+
+        # Only remember validators for a body that was actually decoded
+        if method == "GET":
+            self._store_validators(endpoint, response.headers)
+        return result
+
+    def _store_validators(
+        self, endpoint: str, response_headers: Mapping[str, str]
+    ) -> None:
+        """Remember cache validators of a response for the next request."""
+        validators: dict[str, str] = {}
+        if etag := response_headers.get("ETag"):
+            validators["If-None-Match"] = etag
+        if last_modified := response_headers.get("Last-Modified"):
+            validators["If-Modified-Since"] = last_modified
+
+        if validators:
+            self._validators[endpoint] = validators
+        else:
+            self._validators.pop(endpoint, None)
+
+    def _cache_parsed(
+        self, endpoint: str, parse: Callable[[Any], Any], data: Any
+    ) -> Any:
+        """Parse a response and cache the result next to its validators.
+
+        If parsing fails the validators of the new response are dropped too,
+        otherwise the next request would get a 304 for a body that was never
+        parsed and the previously cached object would be served as current.
+        """
+        try:
+            parsed = parse(data)
+        except Exception:
+            self._validators.pop(endpoint, None)
+            self._parsed_cache.pop(endpoint, None)
+            raise
+        self._parsed_cache[endpoint] = parsed
+        return parsed
+
     async def async_ensure_valid_token(self) -> bool:
         """Ensure we have a valid token, refreshing if needed.
         
@@ -333,16 +425,37 @@ class OmoLavanderiaApiClient:
         return [Laundry.from_list_item(item) for item in items]
 
     async def async_get_laundry(self, laundry_id: str) -> Laundry:
-        """Get laundry details including machines."""
-        data = await self._request("GET", f"/laundry/{laundry_id}")
-        return Laundry.from_detail(data)
+        """Get laundry details including machines.
+
+        The same laundry instance is returned while the server answers HTTP 304.
+        """
+        endpoint = f"/laundry/{laundry_id}"
+        cached = self._parsed_cache.get(endpoint)
+        data = await self._request("GET", endpoint, conditional=cached is not None)
+        if data is _NOT_MODIFIED:
+            return cached
+
+        return self._cache_parsed(endpoint, Laundry.from_detail, data)
 
     async def async_get_active_orders(self) -> list[ActiveOrder]:
         """Get active orders for current user."""
-        data = await self._request("GET", "/order/actives")
-        if isinstance(data, list):
-            return [ActiveOrder.from_dict(order) for order in data]
-        return []
+        bundle = await self.async_get_active_orders_bundle()
+        return bundle.orders
+
+    async def async_get_active_orders_bundle(self) -> ActiveOrdersBundle:
+        """Get active orders for current user with machines indexed by laundry.
+
+        The same bundle instance is returned while the server answers HTTP 304.
+        """
+        endpoint = "/order/actives"
+        cached = self._parsed_cache.get(endpoint)
+        data = await self._request("GET", endpoint, conditional=cached is not None)
+        if data is _NOT_MODIFIED:
+            return cached
+
+        if not isinstance(data, list):
+            data = []
+        return self._cache_parsed(endpoint, ActiveOrdersBundle.from_list, data)
 
     async def async_get_payment_cards(self) -> list[PaymentCard]:
         """Get user's payment cards."""
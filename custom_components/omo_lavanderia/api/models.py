@@ -2,18 +2,18 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from enum import Enum
+from enum import StrEnum
 from typing import Any
 
 
-class MachineType(Enum):
+class MachineType(StrEnum):
     """Machine type enum."""
 
     WASHER = "WASHER"
     DRYER = "DRYER"
 
 
-class MachineStatus(Enum):
+class MachineStatus(StrEnum):
     """Machine status enum."""
 
     AVAILABLE = "AVAILABLE"
@@ -24,7 +24,14 @@ class MachineStatus(Enum):
     OFFLINE = "OFFLINE"
 
 
-@dataclass
+# Enum members by API value, so parsing is a plain dict lookup
+_MACHINE_TYPE_BY_VALUE: dict[str, MachineType] = {m.value: m for m in MachineType}
+_MACHINE_STATUS_BY_VALUE: dict[str, MachineStatus] = {
+    m.value: m for m in MachineStatus
+}
+
+
+@dataclass(slots=True)
 class MachinePrice:
     """Machine price info."""
 
@@ -40,7 +47,7 @@ class MachinePrice:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class MachineUnavailable:
     """Machine unavailable info."""
 
@@ -58,7 +65,7 @@ class MachineUnavailable:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class LaundryMachine:
     """Represents a laundry machine."""
 
@@ -77,30 +84,35 @@ class LaundryMachine:
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> LaundryMachine:
         """Create from API response."""
-        # Handle status with fallback for unknown values
-        status_str = data.get("status", "AVAILABLE")
-        try:
-            status = MachineStatus(status_str)
-        except ValueError:
-            # Unknown status, default to UNAVAILABLE
-            status = MachineStatus.UNAVAILABLE
-            
+        get = data.get
+        # Unknown statuses default to UNAVAILABLE
+        status = _MACHINE_STATUS_BY_VALUE.get(
+            get("status", "AVAILABLE"), MachineStatus.UNAVAILABLE
+        )
+        price = get("price")
+        unavailable = get("unavailable")
+
         return cls(
-            id=data.get("id", ""),
-            code=data.get("code", ""),
-            display_name=data.get("displayName", ""),
-            laundry_id=data.get("laundryId", ""),
-            machine_type=MachineType(data.get("type", "WASHER")),
-            serial=data.get("serial", ""),
-            model=data.get("model", ""),
-            cycle_time=data.get("cycleTime", 30),
+            id=get("id", ""),
+            code=get("code", ""),
+            display_name=get("displayName", ""),
+            laundry_id=get("laundryId", ""),
+            machine_type=_MACHINE_TYPE_BY_VALUE[get("type", "WASHER")],
+            serial=get("serial", ""),
+            model=get("model", ""),
+            cycle_time=get("cycleTime", 30),
             status=status,
-            price=MachinePrice.from_dict(data["price"]) if data.get("price") else None,
-            unavailable=MachineUnavailable.from_dict(data.get("unavailable")),
+            price=MachinePrice.from_dict(price) if price else None,
+            # Most machines are available, so skip the call when there is nothing
+            unavailable=(
+                MachineUnavailable.from_dict(unavailable)
+                if unavailable is not None
+                else None
+            ),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class LaundryAddress:
     """Laundry address."""
 
@@ -112,15 +124,16 @@ class LaundryAddress:
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> LaundryAddress:
         """Create from API response."""
+        get = data.get
         return cls(
-            street=data.get("street", ""),
-            number=data.get("number", 0),
-            neighborhood=data.get("neighborhood", ""),
-            city=data.get("city", ""),
+            street=get("street", ""),
+            number=get("number", 0),
+            neighborhood=get("neighborhood", ""),
+            city=get("city", ""),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Laundry:
     """Represents a laundry location."""
 
@@ -138,41 +151,44 @@ class Laundry:
     @classmethod
     def from_list_item(cls, data: dict[str, Any]) -> Laundry:
         """Create from paginated list item."""
+        get = data.get
         return cls(
-            id=data.get("id", ""),
-            name=data.get("name", ""),
-            code=data.get("code", ""),
-            laundry_type=data.get("type", ""),
-            is_closed=data.get("isClosed", False),
-            is_blocked=data.get("isBlocked", False),
+            id=get("id", ""),
+            name=get("name", ""),
+            code=get("code", ""),
+            laundry_type=get("type", ""),
+            is_closed=get("isClosed", False),
+            is_blocked=get("isBlocked", False),
         )
 
     @classmethod
     def from_detail(cls, data: dict[str, Any]) -> Laundry:
         """Create from laundry detail response."""
-        machines = data.get("machines", {})
-        washers = [LaundryMachine.from_dict(m) for m in machines.get("washers", [])]
-        dryers = [LaundryMachine.from_dict(m) for m in machines.get("dryers", [])]
+        get = data.get
+        machines = get("machines", {})
+        machine_from_dict = LaundryMachine.from_dict
+        washers = [machine_from_dict(m) for m in machines.get("washers", [])]
+        dryers = [machine_from_dict(m) for m in machines.get("dryers", [])]
 
-        address = None
-        if data.get("laundryAddress"):
-            address = LaundryAddress.from_dict(data["laundryAddress"])
+        # The address is normally present, so parse it on the first branch
+        address_data = get("laundryAddress")
+        address = LaundryAddress.from_dict(address_data) if address_data else None
 
         return cls(
-            id=data.get("id", ""),
-            name=data.get("name", ""),
-            code=data.get("code", ""),
-            laundry_type=data.get("type", ""),
-            is_closed=data.get("isClosed", False),
-            is_blocked=data.get("isBlocked", False),
-            payment_mode=data.get("paymentMode", "PREPAID"),
+            id=get("id", ""),
+            name=get("name", ""),
+            code=get("code", ""),
+            laundry_type=get("type", ""),
+            is_closed=get("isClosed", False),
+            is_blocked=get("isBlocked", False),
+            payment_mode=get("paymentMode", "PREPAID"),
             address=address,
             washers=washers,
             dryers=dryers,
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ActiveOrderMachine:
     """Machine in an active order."""
 
@@ -186,17 +202,18 @@ class ActiveOrderMachine:
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> ActiveOrderMachine:
         """Create from API response."""
+        get = data.get
         return cls(
-            id=data.get("id", ""),
-            machine_type=MachineType(data.get("type", "WASHER")),
-            status=data.get("status", ""),
-            remaining_time=data.get("remainingTime", 0),
-            usage_status=data.get("usageStatus", ""),
-            display_name=data.get("displayName", ""),
+            id=get("id", ""),
+            machine_type=_MACHINE_TYPE_BY_VALUE[get("type", "WASHER")],
+            status=get("status", ""),
+            remaining_time=get("remainingTime", 0),
+            usage_status=get("usageStatus", ""),
+            display_name=get("displayName", ""),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ActiveOrder:
     """Represents an active order."""
 
@@ -210,20 +227,56 @@ class ActiveOrder:
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> ActiveOrder:
         """Create from API response."""
-        machines = [
-            ActiveOrderMachine.from_dict(m) for m in data.get("machines", [])
-        ]
+        get = data.get
+        machine_from_dict = ActiveOrderMachine.from_dict
+        machines = [machine_from_dict(m) for m in get("machines", [])]
         return cls(
-            id=data.get("id", ""),
-            laundry_id=data.get("laundryId", ""),
-            laundry_name=data.get("laundryName", ""),
-            total_price=float(data.get("totalPrice", 0)),
-            status=data.get("status", ""),
+            id=get("id", ""),
+            laundry_id=get("laundryId", ""),
+            laundry_name=get("laundryName", ""),
+            total_price=float(get("totalPrice", 0)),
+            status=get("status", ""),
             machines=machines,
         )
 
 
-@dataclass
+@dataclass(slots=True)
+class ActiveOrdersBundle:
+    """Active orders with their machines indexed for lookup."""
+
+    orders: list[ActiveOrder] = field(default_factory=list)
+    orders_by_id: dict[str, ActiveOrder] = field(default_factory=dict)
+    # laundry_id -> machine display name -> (order machine, order id)
+    machines_by_laundry: dict[str, dict[str, tuple[ActiveOrderMachine, str]]] = field(
+        default_factory=dict
+    )
+
+    @classmethod
+    def from_list(cls, data: list[dict[str, Any]]) -> ActiveOrdersBundle:
+        """Create from API response, indexing order machines once."""
+        order_from_dict = ActiveOrder.from_dict
+        orders = [order_from_dict(order) for order in data]
+        orders_by_id = {order.id: order for order in orders}
+        machines_by_laundry: dict[str, dict[str, tuple[ActiveOrderMachine, str]]] = {}
+        for order in orders:
+            by_name = machines_by_laundry.setdefault(order.laundry_id, {})
+            for order_machine in order.machines:
+                # Map by display name since order machines have different IDs
+                by_name[order_machine.display_name] = (order_machine, order.id)
+        return cls(
+            orders=orders,
+            orders_by_id=orders_by_id,
+            machines_by_laundry=machines_by_laundry,
+        )
+
+    def machines_for_laundry(
+        self, laundry_id: str
+    ) -> dict[str, tuple[ActiveOrderMachine, str]]:
+        """Get order machines of a laundry keyed by display name."""
+        return self.machines_by_laundry.get(laundry_id, {})
+
+
+@dataclass(slots=True)
 class PaymentCard:
     """Represents a payment card."""
 
@@ -232,19 +285,21 @@ class PaymentCard:
     holder_name: str
     last_four: str
     brand: str
+    # Derived from the fields above, formatted once at construction
+    display_name: str = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Build the display name for the card."""
+        self.display_name = f"{self.nickname} ({self.brand} ****{self.last_four})"
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> PaymentCard:
         """Create from API response."""
+        get = data.get
         return cls(
-            id=data.get("id", ""),
-            nickname=data.get("nickname", ""),
-            holder_name=data.get("holderName", ""),
-            last_four=data.get("lastFour", ""),
-            brand=data.get("brand", ""),
+            id=get("id", ""),
+            nickname=get("nickname", ""),
+            holder_name=get("holderName", ""),
+            last_four=get("lastFour", ""),
+            brand=get("brand", ""),
         )
-
-    @property
-    def display_name(self) -> str:
-        """Get display name for the card."""
-        return f"{self.nickname} ({self.brand} ****{self.last_four})"
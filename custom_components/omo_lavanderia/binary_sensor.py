@@ -11,7 +11,6 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .api.models import MachineType
 from .const import DOMAIN
 from .coordinator import OmoLavanderiaCoordinator
 from .entity import OmoLavanderiaEntity
@@ -25,17 +24,18 @@ async def async_setup_entry(
     """Set up binary sensors from config entry."""
     coordinator: OmoLavanderiaCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    entities: list[BinarySensorEntity] = []
+    machines = coordinator.data.machines if coordinator.data else {}
 
-    if coordinator.data and coordinator.data.machines:
-        for machine_id in coordinator.data.machines:
-            entities.extend([
-                OmoMachineAvailableBinarySensor(coordinator, machine_id),
-                OmoMachineRunningBinarySensor(coordinator, machine_id),
-                OmoMachineEndingSoonBinarySensor(coordinator, machine_id),
-            ])
-
-    async_add_entities(entities)
+    # Entities are handed over as a generator, no intermediate list is built
+    async_add_entities(
+        sensor_class(coordinator, machine_id)
+        for machine_id in machines
+        for sensor_class in (
+            OmoMachineAvailableBinarySensor,
+            OmoMachineRunningBinarySensor,
+            OmoMachineEndingSoonBinarySensor,
+        )
+    )
 
 
 class OmoMachineAvailableBinarySensor(OmoLavanderiaEntity, BinarySensorEntity):
@@ -57,12 +57,9 @@ class OmoMachineAvailableBinarySensor(OmoLavanderiaEntity, BinarySensorEntity):
     @property
     def icon(self) -> str:
         """Return icon based on machine type and state."""
-        state = self.machine_state
-        is_dryer = state and state.machine and state.machine.machine_type == MachineType.DRYER
-        
         if self.is_on:
-            return "mdi:tumble-dryer" if is_dryer else "mdi:washing-machine"
-        return "mdi:tumble-dryer-off" if is_dryer else "mdi:washing-machine-off"
+            return self._icon
+        return self._icon_off
 
 
 class OmoMachineRunningBinarySensor(OmoLavanderiaEntity, BinarySensorEntity):
@@ -89,12 +86,9 @@ class OmoMachineRunningBinarySensor(OmoLavanderiaEntity, BinarySensorEntity):
     @property
     def icon(self) -> str:
         """Return icon based on machine type."""
-        state = self.machine_state
-        is_dryer = state and state.machine and state.machine.machine_type == MachineType.DRYER
-        
         if self.is_on:
-            return "mdi:tumble-dryer-alert" if is_dryer else "mdi:washing-machine-alert"
-        return "mdi:tumble-dryer" if is_dryer else "mdi:washing-machine"
+            return self._icon_alert
+        return self._icon
 
 
 class OmoMachineEndingSoonBinarySensor(OmoLavanderiaEntity, BinarySensorEntity):
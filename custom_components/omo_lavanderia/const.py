@@ -6,6 +6,9 @@ APP_VERSION = "1.7.0"
 APP_PLATFORM = "web"
 APP_OS_VERSION = "0.0.0"
 DEFAULT_SCAN_INTERVAL = 30  # seconds
+IDLE_SCAN_INTERVAL = DEFAULT_SCAN_INTERVAL * 6  # seconds, when no machine is in use by me
+MAX_SCAN_INTERVAL = 600  # seconds, upper bound when backing off after errors
+MAX_CONCURRENT_REQUESTS = 2  # simultaneous HTTP requests per API client
 
 # Config entry keys
 CONF_LAUNDRY_ID = "laundry_id"
@@ -16,5 +19,17 @@ CONF_ACCESS_TOKEN = "access_token"
 CONF_REFRESH_TOKEN = "refresh_token"
 CONF_TOKEN_EXPIRES_AT = "token_expires_at"
 
+# Machine status sensor states
+STATUS_AVAILABLE = "available"
+STATUS_IN_USE = "in_use"
+STATUS_IN_USE_BY_ME = "in_use_by_me"
+STATUS_UNAVAILABLE = "unavailable"
+MACHINE_STATUS_OPTIONS = [
+    STATUS_AVAILABLE,
+    STATUS_IN_USE,
+    STATUS_IN_USE_BY_ME,
+    STATUS_UNAVAILABLE,
+]
+
 # Service names
 SERVICE_START_CYCLE = "start_cycle"
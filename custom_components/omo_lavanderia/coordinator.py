@@ -3,7 +3,9 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import timedelta
+from itertools import chain
 import logging
+import time
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
@@ -12,38 +14,106 @@ from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, Upda
 
 from .api.client import OmoLavanderiaApiClient
 from .api.exceptions import OmoApiError, OmoAuthError
-from .api.models import ActiveOrder, Laundry, LaundryMachine, MachineStatus
+from .api.models import (
+    ActiveOrder,
+    ActiveOrderMachine,
+    ActiveOrdersBundle,
+    Laundry,
+    LaundryMachine,
+    MachineStatus,
+)
 from .const import (
     CONF_ACCESS_TOKEN,
     CONF_REFRESH_TOKEN,
     CONF_TOKEN_EXPIRES_AT,
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
+    IDLE_SCAN_INTERVAL,
+    MAX_SCAN_INTERVAL,
+    STATUS_AVAILABLE,
+    STATUS_IN_USE,
+    STATUS_IN_USE_BY_ME,
+    STATUS_UNAVAILABLE,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# Order usage statuses where the cycle is over and the machine is no longer ours
+_IDLE_USAGE_STATUSES: frozenset[str] = frozenset({"COMPLETE", "AVAILABLE"})
+
 
-@dataclass
+@dataclass(slots=True)
 class MachineState:
     """State of a single machine."""
 
     machine: LaundryMachine
-    is_available: bool = False
-    is_in_use_by_me: bool = False
     is_running: bool = False  # True only when actually running (IN_USE with remainingTime > 0)
     remaining_time_seconds: int | None = None
-    order_id: str | None = None
+    order_id: str | None = None  # Set only when one of my active orders holds the machine
+    order_machine: ActiveOrderMachine | None = None  # This machine's entry in that order
     usage_status: str = "AVAILABLE"  # AVAILABLE, READY, IN_USE, COMPLETE, UNAVAILABLE, OFFLINE
+    status_label: str = STATUS_UNAVAILABLE  # in_use_by_me, available, in_use, unavailable
+
+    @property
+    def is_available(self) -> bool:
+        """Return True if the machine is free to be started."""
+        return self.machine.status is MachineStatus.AVAILABLE
+
+    @property
+    def is_in_use_by_me(self) -> bool:
+        """Return True if one of my orders holds the machine and its cycle is not complete."""
+        return self.order_id is not None and self.usage_status not in _IDLE_USAGE_STATUSES
+
+
+def _update_machine_state(
+    state: MachineState | None,
+    machine: LaundryMachine,
+    *,
+    is_running: bool = False,
+    remaining_time_seconds: int | None = None,
+    order_id: str | None = None,
+    order_machine: ActiveOrderMachine | None = None,
+    usage_status: str | None = None,
+) -> MachineState:
+    """Update the previous state of a machine in place, or create a new one.
 
+    The defaults describe a machine without an order of mine, whose usage
+    status then comes from the machine status itself.
+    """
+    is_available = machine.status is MachineStatus.AVAILABLE
+    if usage_status is None:
+        usage_status = "AVAILABLE" if is_available else machine.status.value
 
-@dataclass
+    if state is None:
+        state = MachineState(machine=machine)
+    else:
+        state.machine = machine
+    state.is_running = is_running
+    state.remaining_time_seconds = remaining_time_seconds
+    state.order_id = order_id
+    state.order_machine = order_machine
+    state.usage_status = usage_status
+    if state.is_in_use_by_me:
+        state.status_label = STATUS_IN_USE_BY_ME
+    elif is_available:
+        state.status_label = STATUS_AVAILABLE
+    elif machine.status is MachineStatus.IN_USE:
+        state.status_label = STATUS_IN_USE
+    else:
+        state.status_label = STATUS_UNAVAILABLE
+    return state
+
+
+@dataclass(slots=True)
 class OmoLavanderiaData:
     """Data from the coordinator."""
 
     laundry: Laundry | None = None
     active_orders: list[ActiveOrder] = field(default_factory=list)
+    orders_by_id: dict[str, ActiveOrder] = field(default_factory=dict)
     machines: dict[str, MachineState] = field(default_factory=dict)
+    # Filtered view of machines, filled in the same pass that builds them
+    machines_in_use_by_me: list[MachineState] = field(default_factory=list)
 
 
 class OmoLavanderiaCoordinator(DataUpdateCoordinator[OmoLavanderiaData]):
@@ -68,6 +138,9 @@ class OmoLavanderiaCoordinator(DataUpdateCoordinator[OmoLavanderiaData]):
         self._config_entry = config_entry
         self._consecutive_errors: int = 0
         self._last_successful_update: float = 0
+        # Machine states are kept across polls and updated in place
+        self._machine_states: dict[str, MachineState] = {}
+        self._active_orders: ActiveOrdersBundle | None = None
 
         # Set up token update callback to persist tokens
         client.set_token_update_callback(self._on_token_update)
@@ -95,10 +168,9 @@ class OmoLavanderiaCoordinator(DataUpdateCoordinator[OmoLavanderiaData]):
 
     async def _async_update_data(self) -> OmoLavanderiaData:
         """Fetch data from API with improved error handling."""
-        import time
-        
         try:
-            # Ensure we have a valid token before making requests
+            # Ensure we have a valid token before making requests. This is the
+            # single proactive refresh per cycle, shared by all entities.
             await self.client.async_ensure_valid_token()
 
             # Fetch laundry details and active orders
@@ -106,10 +178,20 @@ class OmoLavanderiaCoordinator(DataUpdateCoordinator[OmoLavanderiaData]):
             laundry = await self.client.async_get_laundry(self.laundry_id)
             
             _LOGGER.debug("Fetching active orders")
-            active_orders = await self.client.async_get_active_orders()
+            active_orders = await self.client.async_get_active_orders_bundle()
 
-            # Build machine states
-            machines = self._build_machine_states(laundry, active_orders)
+            previous = self.data
+            if (
+                previous is not None
+                and laundry is previous.laundry
+                and active_orders is self._active_orders
+            ):
+                # The client returned its cached objects (HTTP 304), nothing changed
+                data = previous
+            else:
+                # Build machine states
+                data = self._build_data(laundry, active_orders)
+            self._active_orders = active_orders
             
             # Success - reset error counter
             self._consecutive_errors = 0
@@ -117,15 +199,12 @@ class OmoLavanderiaCoordinator(DataUpdateCoordinator[OmoLavanderiaData]):
             
             _LOGGER.debug(
                 "Update complete: %d machines, %d active orders",
-                len(machines),
-                len(active_orders),
+                len(data.machines),
+                len(data.active_orders),
             )
 
-            return OmoLavanderiaData(
-                laundry=laundry,
-                active_orders=active_orders,
-                machines=machines,
-            )
+            self._adjust_update_interval(data)
+            return data
 
         except OmoAuthError as err:
             self._consecutive_errors += 1
@@ -134,6 +213,7 @@ class OmoLavanderiaCoordinator(DataUpdateCoordinator[OmoLavanderiaData]):
                 self._consecutive_errors,
                 err,
             )
+            self._adjust_update_interval(self.data)
             # Keep existing data on transient auth errors
             if self.data and self._consecutive_errors < 3:
                 _LOGGER.warning("Using cached data due to auth error")
@@ -146,6 +226,7 @@ class OmoLavanderiaCoordinator(DataUpdateCoordinator[OmoLavanderiaData]):
                 self._consecutive_errors,
                 err,
             )
+            self._adjust_update_interval(self.data)
             # Keep existing data on transient errors
             if self.data and self._consecutive_errors < 5:
                 _LOGGER.warning("Using cached data due to API error")
@@ -158,17 +239,39 @@ class OmoLavanderiaCoordinator(DataUpdateCoordinator[OmoLavanderiaData]):
                 self._consecutive_errors,
                 err,
             )
+            self._adjust_update_interval(self.data)
             # Keep existing data on transient errors
             if self.data and self._consecutive_errors < 5:
                 _LOGGER.warning("Using cached data due to unexpected error")
                 return self.data
             raise UpdateFailed(f"Unexpected error: {err}") from err
 
-    def get_diagnostics(self) -> dict[str, Any]:
-        """Get diagnostic information for troubleshooting."""
-        import time
-        
-        token_status = self.client.get_token_status()
+    def _adjust_update_interval(self, data: OmoLavanderiaData | None) -> None:
+        """Poll fast while a cycle of mine is active, slower when idle or failing."""
+        if data is not None and data.machines_in_use_by_me:
+            seconds = DEFAULT_SCAN_INTERVAL
+        else:
+            seconds = IDLE_SCAN_INTERVAL
+
+        # Back off from the regular interval on consecutive failures
+        if self._consecutive_errors:
+            seconds = min(seconds * 2 ** self._consecutive_errors, MAX_SCAN_INTERVAL)
+
+        if self.update_interval is None or self.update_interval.total_seconds() != seconds:
+            _LOGGER.debug("Setting update interval to %d seconds", seconds)
+            self.update_interval = timedelta(seconds=seconds)
+
+    def get_diagnostics(
+        self, token_status: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        """Get diagnostic information for troubleshooting.
+
+        An already fetched client token status can be passed in to avoid
+        computing it again.
+        """
+        if token_status is None:
+            token_status = self.client.get_token_status()
+        data = self.data
         
         return {
             "token": token_status,
@@ -180,76 +283,83 @@ class OmoLavanderiaCoordinator(DataUpdateCoordinator[OmoLavanderiaData]):
                     if self._last_successful_update > 0
                     else None
                 ),
-                "has_data": self.data is not None,
-                "machine_count": len(self.data.machines) if self.data else 0,
-                "active_order_count": (
-                    len(self.data.active_orders) if self.data else 0
-                ),
+                "has_data": data is not None,
+                "machine_count": len(data.machines) if data else 0,
+                "active_order_count": len(data.active_orders) if data else 0,
             },
             "laundry_id": self.laundry_id,
             "username": self.client.username,
         }
 
-    def _build_machine_states(
+    def _build_data(
         self,
         laundry: Laundry,
-        active_orders: list[ActiveOrder],
-    ) -> dict[str, MachineState]:
-        """Build machine states merging laundry data with active orders."""
+        active_orders: ActiveOrdersBundle,
+    ) -> OmoLavanderiaData:
+        """Build coordinator data merging laundry data with active orders."""
         machines: dict[str, MachineState] = {}
+        machines_in_use_by_me: list[MachineState] = []
+
+        # Order machines of this laundry, indexed by display name by the client
+        active_machine_map = active_orders.machines_for_laundry(self.laundry_id)
 
-        # Create lookup for active order machines
-        # Stores: (remaining_time, order_id, usage_status)
-        active_machine_map: dict[str, tuple[int, str, str]] = {}
-        for order in active_orders:
-            if order.laundry_id == self.laundry_id:
-                for order_machine in order.machines:
-                    # Map by display name since order machines have different IDs
-                    active_machine_map[order_machine.display_name] = (
-                        order_machine.remaining_time,
-                        order.id,
-                        order_machine.usage_status,
+        # Process all machines, reusing the states from the previous poll
+        previous_states = self._machine_states
+        all_machines = chain(laundry.washers, laundry.dryers)
+
+        if not active_machine_map:
+            # Common case: no orders of mine here, so the machine status is all we need
+            for machine in all_machines:
+                machines[machine.id] = _update_machine_state(
+                    previous_states.get(machine.id), machine
+                )
+        else:
+            for machine in all_machines:
+                active_entry = active_machine_map.get(machine.display_name)
+                if active_entry is None:
+                    machines[machine.id] = _update_machine_state(
+                        previous_states.get(machine.id), machine
                     )
+                    continue
+
+                order_machine, order_id = active_entry
+                remaining_time = order_machine.remaining_time
+                usage_status = order_machine.usage_status
 
-        # Process all machines
-        all_machines = laundry.washers + laundry.dryers
-        for machine in all_machines:
-            is_available = machine.status == MachineStatus.AVAILABLE
-            has_active_order = machine.display_name in active_machine_map
-            remaining_time = None
-            order_id = None
-            usage_status: str = "AVAILABLE" if is_available else machine.status.value
-            is_running = False
-            is_in_use_by_me = False
-
-            if has_active_order:
-                remaining_time, order_id, usage_status = active_machine_map[machine.display_name]
-                
-                # Machine is only "in use by me" if cycle is not complete
-                # COMPLETE status means the cycle finished - user just needs to pick up laundry
-                is_in_use_by_me = usage_status not in ("COMPLETE", "AVAILABLE")
-                
                 # Machine is only "running" if usageStatus is IN_USE and has remaining time
                 is_running = usage_status == "IN_USE" and remaining_time is not None and remaining_time > 0
-                
+
                 # Only set remaining_time if actually running, to prevent false triggers
                 if not is_running:
                     remaining_time = None
 
-            machines[machine.id] = MachineState(
-                machine=machine,
-                is_available=is_available,
-                is_in_use_by_me=is_in_use_by_me,
-                is_running=is_running,
-                remaining_time_seconds=remaining_time,
-                order_id=order_id,
-                usage_status=usage_status,
-            )
+                state = _update_machine_state(
+                    previous_states.get(machine.id),
+                    machine,
+                    is_running=is_running,
+                    remaining_time_seconds=remaining_time,
+                    order_id=order_id,
+                    order_machine=order_machine,
+                    usage_status=usage_status,
+                )
+                machines[machine.id] = state
+                # Not once the cycle is COMPLETE: the laundry just needs picking up
+                if state.is_in_use_by_me:
+                    machines_in_use_by_me.append(state)
 
-        return machines
+        # Machines that disappeared from the laundry are dropped here
+        self._machine_states = machines
+        return OmoLavanderiaData(
+            laundry=laundry,
+            active_orders=active_orders.orders,
+            orders_by_id=active_orders.orders_by_id,
+            machines=machines,
+            machines_in_use_by_me=machines_in_use_by_me,
+        )
 
     def get_machine_state(self, machine_id: str) -> MachineState | None:
         """Get state for a specific machine."""
-        if self.data:
-            return self.data.machines.get(machine_id)
+        data = self.data
+        if data is not None:
+            return data.machines.get(machine_id)
         return None
@@ -23,29 +23,55 @@ class OmoLavanderiaEntity(CoordinatorEntity[OmoLavanderiaCoordinator]):
         super().__init__(coordinator)
         self._machine_id = machine_id
 
+        # Machine type never changes, so resolve the icons once
+        state = coordinator.get_machine_state(machine_id)
+        self._is_dryer = (
+            state is not None and state.machine.machine_type is MachineType.DRYER
+        )
+        if self._is_dryer:
+            self._icon = "mdi:tumble-dryer"
+            self._icon_alert = "mdi:tumble-dryer-alert"
+            self._icon_off = "mdi:tumble-dryer-off"
+        else:
+            self._icon = "mdi:washing-machine"
+            self._icon_alert = "mdi:washing-machine-alert"
+            self._icon_off = "mdi:washing-machine-off"
+
+        # Device name, model and area are fixed for the machine, so the
+        # device info is built once here rather than on every read
+        machine = state.machine if state else None
+        laundry = coordinator.data.laundry if coordinator.data else None
+        machine_name = machine.display_name if machine else "Machine"
+        # Use friendly names for device type
+        type_name = "Secadora" if self._is_dryer else "Lavadora"
+        self._device_name = f"{type_name} {machine_name}"
+        self._device_model = machine.model if machine else None
+        self._laundry_short = laundry.name.split(" - ")[-1][:20] if laundry else "Omo"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, machine_id)},
+            name=self._device_name,
+            manufacturer="Omo Lavanderia",
+            model=self._device_model,
+            suggested_area=self._laundry_short,
+        )
+
     @property
     def machine_state(self) -> MachineState | None:
         """Get current machine state from coordinator."""
         return self.coordinator.get_machine_state(self._machine_id)
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info for this machine."""
-        state = self.machine_state
-        machine = state.machine if state else None
-        laundry = self.coordinator.data.laundry if self.coordinator.data else None
 
-        machine_name = machine.display_name if machine else "Machine"
-        is_dryer = machine and machine.machine_type == MachineType.DRYER
-        
-        # Use friendly names for device type
-        type_name = "Secadora" if is_dryer else "Lavadora"
-        laundry_short = laundry.name.split(" - ")[-1][:20] if laundry else "Omo"
+class OmoLavanderiaLaundryEntity(CoordinatorEntity[OmoLavanderiaCoordinator]):
+    """Base entity for laundry-wide data, attached to the laundry device."""
 
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._machine_id)},
-            name=f"{type_name} {machine_name}",
+    _attr_has_entity_name = True
+
+    def __init__(self, coordinator: OmoLavanderiaCoordinator) -> None:
+        """Initialize entity."""
+        super().__init__(coordinator)
+        laundry = coordinator.data.laundry if coordinator.data else None
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, coordinator.laundry_id)},
+            name=laundry.name if laundry else "Omo Lavanderia",
             manufacturer="Omo Lavanderia",
-            model=machine.model if machine else None,
-            suggested_area=laundry_short,
         )
@@ -1,25 +1,58 @@
 """Sensor entities for Omo Lavanderia."""
 from __future__ import annotations
 
-import logging
-import time
-from datetime import datetime
-from typing import Any
+from abc import abstractmethod
+from collections.abc import Mapping
+from datetime import UTC, datetime
+from functools import lru_cache
+from itertools import chain
+from types import MappingProxyType
+from typing import Any, Final
 
 from homeassistant.components.sensor import (
+    DOMAIN as SENSOR_DOMAIN,
     SensorDeviceClass,
     SensorEntity,
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory, UnitOfTime
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.typing import StateType
 
-from .api.models import MachineType
-from .const import DOMAIN
+from .const import DOMAIN, MACHINE_STATUS_OPTIONS, STATUS_AVAILABLE
 from .coordinator import OmoLavanderiaCoordinator
-from .entity import OmoLavanderiaEntity
+from .entity import OmoLavanderiaEntity, OmoLavanderiaLaundryEntity
+
+# Unique ID suffixes appended to the machine ID (laundry ID for diagnostics)
+_SUFFIX_REMAINING_TIME = "_remaining_time"
+_SUFFIX_CYCLE_TIME = "_cycle_time"
+_SUFFIX_PRICE = "_price"
+_SUFFIX_STATUS = "_status"
+_SUFFIX_DIAGNOSTIC = "_diagnostic"
+
+# Diagnostic sensor icon per connection status
+_DIAG_ICONS: Final[Mapping[str, str]] = MappingProxyType({
+    "connected": "mdi:check-network",
+    "no_token": "mdi:network-off",
+    "token_expired": "mdi:alert-circle",
+    "token_expiring": "mdi:clock-alert",
+    "auth_issues": "mdi:alert",
+})
+
+
+@lru_cache(maxsize=8)
+def _timestamp_to_iso(timestamp: float) -> str | None:
+    """Format a Unix timestamp as ISO 8601 in UTC, or None when unset.
+
+    The same few timestamps are formatted on every state write until the
+    token or the last successful update changes, so the results are cached.
+    """
+    if timestamp <= 0:
+        return None
+    return datetime.fromtimestamp(timestamp, tz=UTC).isoformat()
 
 
 async def async_setup_entry(
@@ -30,22 +63,72 @@ async def async_setup_entry(
     """Set up sensors from config entry."""
     coordinator: OmoLavanderiaCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    entities: list[SensorEntity] = []
+    machines = coordinator.data.machines if coordinator.data else {}
+
+    # Diagnostics used to be created per machine; drop those leftover entries
+    diagnostic_unique_id = coordinator.laundry_id + _SUFFIX_DIAGNOSTIC
+    entity_registry = er.async_get(hass)
+    for registry_entry in er.async_entries_for_config_entry(
+        entity_registry, entry.entry_id
+    ):
+        if (
+            registry_entry.domain == SENSOR_DOMAIN
+            and registry_entry.unique_id.endswith(_SUFFIX_DIAGNOSTIC)
+            and registry_entry.unique_id != diagnostic_unique_id
+        ):
+            entity_registry.async_remove(registry_entry.entity_id)
+
+    # Entities are handed over as a generator, no intermediate list is built
+    async_add_entities(
+        chain(
+            (
+                sensor_class(coordinator, machine_id)
+                for machine_id in machines
+                for sensor_class in (
+                    OmoRemainingTimeSensor,
+                    OmoCycleTimeSensor,
+                    OmoPriceSensor,
+                    OmoMachineStatusSensor,
+                )
+            ),
+            (OmoDiagnosticSensor(coordinator),),
+        )
+    )
+
+
+class OmoMachineSensor(OmoLavanderiaEntity, SensorEntity):
+    """Base machine sensor that only writes state when its value changes.
+
+    Subclasses compute their value in _compute_value(), which runs once per
+    coordinator update instead of on every state read.
+    """
+
+    def __init__(self, coordinator: OmoLavanderiaCoordinator, machine_id: str) -> None:
+        """Initialize sensor."""
+        super().__init__(coordinator, machine_id)
+        self._attr_native_value = self._compute_value()
+        self._last_available = self.available
+
+    @abstractmethod
+    def _compute_value(self) -> StateType:
+        """Compute the sensor value from the current machine state."""
 
-    if coordinator.data and coordinator.data.machines:
-        for machine_id in coordinator.data.machines:
-            entities.extend([
-                OmoRemainingTimeSensor(coordinator, machine_id),
-                OmoCycleTimeSensor(coordinator, machine_id),
-                OmoPriceSensor(coordinator, machine_id),
-                OmoMachineStatusSensor(coordinator, machine_id),
-                OmoDiagnosticSensor(coordinator, machine_id),
-            ])
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when the value or availability changed."""
+        value = self._compute_value()
+        value_changed = value != self._attr_native_value
+        # Assign first: availability may be derived from the new value
+        self._attr_native_value = value
+        available = self.available
+        if not value_changed and available == self._last_available:
+            return
 
-    async_add_entities(entities)
+        self._last_available = available
+        self.async_write_ha_state()
 
 
-class OmoRemainingTimeSensor(OmoLavanderiaEntity, SensorEntity):
+class OmoRemainingTimeSensor(OmoMachineSensor):
     """Sensor for remaining cycle time."""
 
     _attr_device_class = SensorDeviceClass.DURATION
@@ -53,22 +136,13 @@ class OmoRemainingTimeSensor(OmoLavanderiaEntity, SensorEntity):
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_translation_key = "remaining_time"
 
-    @property
-    def icon(self) -> str:
-        """Return icon based on machine type."""
-        state = self.machine_state
-        if state and state.machine:
-            if state.machine.machine_type == MachineType.DRYER:
-                return "mdi:tumble-dryer"
-        return "mdi:washing-machine"
-
     def __init__(self, coordinator: OmoLavanderiaCoordinator, machine_id: str) -> None:
         """Initialize sensor."""
         super().__init__(coordinator, machine_id)
-        self._attr_unique_id = f"{machine_id}_remaining_time"
+        self._attr_unique_id = machine_id + _SUFFIX_REMAINING_TIME
+        self._attr_icon = self._icon
 
-    @property
-    def native_value(self) -> int | None:
+    def _compute_value(self) -> int | None:
         """Return remaining time in seconds.
         
         Only returns a value when the machine is actually running (IN_USE with time remaining).
@@ -83,13 +157,13 @@ class OmoRemainingTimeSensor(OmoLavanderiaEntity, SensorEntity):
     def available(self) -> bool:
         """Return if sensor is available.
         
-        Only available when machine is actually running.
+        Only available when machine is actually running, which is exactly
+        when a remaining time was computed.
         """
-        state = self.machine_state
-        return state is not None and state.is_running
+        return super().available and self._attr_native_value is not None
 
 
-class OmoCycleTimeSensor(OmoLavanderiaEntity, SensorEntity):
+class OmoCycleTimeSensor(OmoMachineSensor):
     """Sensor for machine cycle time."""
 
     _attr_device_class = SensorDeviceClass.DURATION
@@ -101,10 +175,9 @@ class OmoCycleTimeSensor(OmoLavanderiaEntity, SensorEntity):
     def __init__(self, coordinator: OmoLavanderiaCoordinator, machine_id: str) -> None:
         """Initialize sensor."""
         super().__init__(coordinator, machine_id)
-        self._attr_unique_id = f"{machine_id}_cycle_time"
+        self._attr_unique_id = machine_id + _SUFFIX_CYCLE_TIME
 
-    @property
-    def native_value(self) -> int | None:
+    def _compute_value(self) -> int | None:
         """Return cycle time in minutes."""
         state = self.machine_state
         if state and state.machine:
@@ -112,7 +185,7 @@ class OmoCycleTimeSensor(OmoLavanderiaEntity, SensorEntity):
         return None
 
 
-class OmoPriceSensor(OmoLavanderiaEntity, SensorEntity):
+class OmoPriceSensor(OmoMachineSensor):
     """Sensor for machine price."""
 
     _attr_device_class = SensorDeviceClass.MONETARY
@@ -124,10 +197,9 @@ class OmoPriceSensor(OmoLavanderiaEntity, SensorEntity):
     def __init__(self, coordinator: OmoLavanderiaCoordinator, machine_id: str) -> None:
         """Initialize sensor."""
         super().__init__(coordinator, machine_id)
-        self._attr_unique_id = f"{machine_id}_price"
+        self._attr_unique_id = machine_id + _SUFFIX_PRICE
 
-    @property
-    def native_value(self) -> float | None:
+    def _compute_value(self) -> float | None:
         """Return machine price."""
         state = self.machine_state
         if state and state.machine and state.machine.price:
@@ -135,56 +207,46 @@ class OmoPriceSensor(OmoLavanderiaEntity, SensorEntity):
         return None
 
 
-class OmoMachineStatusSensor(OmoLavanderiaEntity, SensorEntity):
+class OmoMachineStatusSensor(OmoMachineSensor):
     """Sensor for machine status."""
 
     _attr_device_class = SensorDeviceClass.ENUM
-    _attr_options = ["available", "in_use", "in_use_by_me", "unavailable"]
+    _attr_options = MACHINE_STATUS_OPTIONS
     _attr_translation_key = "machine_status"
 
     @property
     def icon(self) -> str:
         """Return icon based on machine type and state."""
-        state = self.machine_state
-        is_dryer = state and state.machine and state.machine.machine_type == MachineType.DRYER
-        
-        if state and (state.is_in_use_by_me or not state.is_available):
-            return "mdi:tumble-dryer-alert" if is_dryer else "mdi:washing-machine-alert"
-        return "mdi:tumble-dryer" if is_dryer else "mdi:washing-machine"
+        # Every status other than available means in use or blocked
+        if self._attr_native_value is None or self._attr_native_value == STATUS_AVAILABLE:
+            return self._icon
+        return self._icon_alert
 
     def __init__(self, coordinator: OmoLavanderiaCoordinator, machine_id: str) -> None:
         """Initialize sensor."""
         super().__init__(coordinator, machine_id)
-        self._attr_unique_id = f"{machine_id}_status"
+        self._attr_unique_id = machine_id + _SUFFIX_STATUS
 
-    @property
-    def native_value(self) -> str | None:
+    def _compute_value(self) -> str | None:
         """Return machine status."""
         state = self.machine_state
-        if state is None:
-            return None
-
-        if state.is_in_use_by_me:
-            return "in_use_by_me"
-        if state.is_available:
-            return "available"
-        if state.machine.status.value == "IN_USE":
-            return "in_use"
-        return "unavailable"
+        return state.status_label if state else None
 
 
-class OmoDiagnosticSensor(OmoLavanderiaEntity, SensorEntity):
+class OmoDiagnosticSensor(OmoLavanderiaLaundryEntity, SensorEntity):
     """Diagnostic sensor for connectivity and session debugging.
     
-    This sensor provides:
+    A single sensor per laundry providing:
     - Token status and expiration info
     - Connection health metrics
-    - Active order/session details when machine is in use
+    - Per-machine status and active order/session details
     """
 
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_icon = "mdi:bug"
     _attr_translation_key = "diagnostic"
+    # The per-machine details change on every poll, keep them out of the recorder
+    _unrecorded_attributes = frozenset({"machines"})
     
     # Usage status translations
     USAGE_STATUS_TRANSLATIONS = {
@@ -196,10 +258,25 @@ class OmoDiagnosticSensor(OmoLavanderiaEntity, SensorEntity):
         "OFFLINE": "Offline",
     }
 
-    def __init__(self, coordinator: OmoLavanderiaCoordinator, machine_id: str) -> None:
+    def __init__(self, coordinator: OmoLavanderiaCoordinator) -> None:
         """Initialize diagnostic sensor."""
-        super().__init__(coordinator, machine_id)
-        self._attr_unique_id = f"{machine_id}_diagnostic"
+        super().__init__(coordinator)
+        self._attr_unique_id = coordinator.laundry_id + _SUFFIX_DIAGNOSTIC
+        # Token status of the current coordinator update, shared by the
+        # state, icon and attributes of a single state write
+        self._token_status: dict[str, Any] | None = None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Drop the cached token status and write the new state."""
+        self._token_status = None
+        super()._handle_coordinator_update()
+
+    def _get_token_status(self) -> dict[str, Any]:
+        """Return the client token status, computed once per update."""
+        if self._token_status is None:
+            self._token_status = self.coordinator.client.get_token_status()
+        return self._token_status
 
     def _get_usage_status_display(self, status: str) -> str:
         """Get user-friendly display name for usage status."""
@@ -208,7 +285,7 @@ class OmoDiagnosticSensor(OmoLavanderiaEntity, SensorEntity):
     @property
     def native_value(self) -> str:
         """Return connection status as main value."""
-        token_status = self.coordinator.client.get_token_status()
+        token_status = self._get_token_status()
         
         if not token_status["has_token"]:
             return "no_token"
@@ -223,100 +300,77 @@ class OmoDiagnosticSensor(OmoLavanderiaEntity, SensorEntity):
     @property
     def icon(self) -> str:
         """Return icon based on connection status."""
-        status = self.native_value
-        icons = {
-            "connected": "mdi:check-network",
-            "no_token": "mdi:network-off",
-            "token_expired": "mdi:alert-circle",
-            "token_expiring": "mdi:clock-alert",
-            "auth_issues": "mdi:alert",
-        }
-        return icons.get(status, "mdi:bug")
+        return _DIAG_ICONS.get(self.native_value, "mdi:bug")
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return detailed diagnostic attributes."""
-        diagnostics = self.coordinator.get_diagnostics()
-        state = self.machine_state
+        diagnostics = self.coordinator.get_diagnostics(self._get_token_status())
+        diag_token = diagnostics["token"]
+        diag_coord = diagnostics["coordinator"]
+        data = self.coordinator.data
         
-        # Base attributes from coordinator diagnostics
-        attrs: dict[str, Any] = {
+        # Machine-specific info, keyed by machine ID
+        machines: dict[str, dict[str, Any]] = {}
+        if data is not None:
+            orders_by_id = data.orders_by_id
+            for machine_id, state in data.machines.items():
+                machine = state.machine
+                usage_status = state.usage_status
+                order_id = state.order_id
+                is_in_use_by_me = state.is_in_use_by_me
+
+                machine_attrs: dict[str, Any] = {
+                    "machine_code": machine.code,
+                    "machine_status": machine.status.value,
+                    "is_available": state.is_available,
+                    "is_in_use_by_me": is_in_use_by_me,
+                    "is_running": state.is_running,
+                    # Translate usage_status to user-friendly value
+                    "usage_status": self._get_usage_status_display(usage_status),
+                    "usage_status_raw": usage_status,
+                }
+
+                # Active order/session details when in use
+                if is_in_use_by_me and order_id:
+                    machine_attrs["order_id"] = order_id
+                    machine_attrs["remaining_time_seconds"] = state.remaining_time_seconds
+
+                    order = orders_by_id.get(order_id)
+                    if order is not None:
+                        machine_attrs.update({
+                            "order_laundry_name": order.laundry_name,
+                            "order_total_price": order.total_price,
+                            "order_status": order.status,
+                        })
+                        # This machine's entry in the order
+                        order_machine = state.order_machine
+                        if order_machine is not None:
+                            machine_attrs.update({
+                                "order_machine_status": order_machine.status,
+                                "order_machine_usage_status": order_machine.usage_status,
+                                "order_machine_remaining_time": order_machine.remaining_time,
+                            })
+
+                machines[machine_id] = machine_attrs
+
+        return {
             # Token info
-            "token_valid": not diagnostics["token"]["is_expired"],
-            "token_expiring_soon": diagnostics["token"]["is_expiring_soon"],
-            "token_expires_in_seconds": diagnostics["token"]["time_until_expiry_seconds"],
-            "token_expires_at": (
-                datetime.fromtimestamp(diagnostics["token"]["expires_at"]).isoformat()
-                if diagnostics["token"]["expires_at"] > 0
-                else None
-            ),
-            "login_failures": diagnostics["token"]["login_failures"],
+            "token_valid": not diag_token["is_expired"],
+            "token_expiring_soon": diag_token["is_expiring_soon"],
+            "token_expires_in_seconds": diag_token["time_until_expiry_seconds"],
+            "token_expires_at": _timestamp_to_iso(diag_token["expires_at"]),
+            "login_failures": diag_token["login_failures"],
             
             # Coordinator health
-            "consecutive_errors": diagnostics["coordinator"]["consecutive_errors"],
-            "last_successful_update": (
-                datetime.fromtimestamp(
-                    diagnostics["coordinator"]["last_successful_update"]
-                ).isoformat()
-                if diagnostics["coordinator"]["last_successful_update"] > 0
-                else None
+            "consecutive_errors": diag_coord["consecutive_errors"],
+            "last_successful_update": _timestamp_to_iso(
+                diag_coord["last_successful_update"]
             ),
-            "seconds_since_success": diagnostics["coordinator"]["seconds_since_success"],
+            "seconds_since_success": diag_coord["seconds_since_success"],
             
             # Connection info
             "laundry_id": diagnostics["laundry_id"],
             "username": diagnostics["username"],
+            "machines": machines,
         }
-
-        # Machine-specific info
-        if state:
-            # Translate usage_status to user-friendly value
-            usage_status_display = self._get_usage_status_display(state.usage_status)
-            
-            attrs.update({
-                "machine_id": state.machine.id if state.machine else None,
-                "machine_code": state.machine.code if state.machine else None,
-                "machine_status": state.machine.status.value if state.machine else None,
-                "is_available": state.is_available,
-                "is_in_use_by_me": state.is_in_use_by_me,
-                "is_running": state.is_running,
-                "usage_status": usage_status_display,
-                "usage_status_raw": state.usage_status,
-            })
-
-            # Active order/session details when in use
-            if state.is_in_use_by_me and state.order_id:
-                attrs["order_id"] = state.order_id
-                attrs["remaining_time_seconds"] = state.remaining_time_seconds
-                
-                # Find the full order details
-                if self.coordinator.data and self.coordinator.data.active_orders:
-                    for order in self.coordinator.data.active_orders:
-                        if order.id == state.order_id:
-                            attrs.update({
-                                "order_laundry_name": order.laundry_name,
-                                "order_total_price": order.total_price,
-                                "order_status": order.status,
-                            })
-                            # Find this machine in the order
-                            for order_machine in order.machines:
-                                if order_machine.display_name == state.machine.display_name:
-                                    attrs.update({
-                                        "order_machine_status": order_machine.status,
-                                        "order_machine_usage_status": order_machine.usage_status,
-                                        "order_machine_remaining_time": order_machine.remaining_time,
-                                    })
-                                    break
-                            break
-
-        return attrs
-
-    async def async_update(self) -> None:
-        """Force token refresh if expired during update."""
-        # Check and refresh token proactively
-        if self.coordinator.client.is_token_expired():
-            try:
-                await self.coordinator.client.async_ensure_valid_token()
-            except Exception as err:
-                # Log but don't fail - the status will show the error
-                logging.getLogger(__name__).debug("Token refresh failed: %s", err)
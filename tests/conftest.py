@@ -7,12 +7,17 @@ import pytest
 @pytest.fixture
 def hass():
     """Create a mock Home Assistant instance."""
-    hass = MagicMock()
+    hass = MagicMock(spec_set=["data", "config_entries"])
     hass.data = {}
-    hass.config_entries = MagicMock()
-    hass.config_entries.flow = MagicMock()
-    hass.config_entries.flow.async_init = MagicMock()
-    hass.config_entries.flow.async_configure = MagicMock()
+    hass.config_entries = MagicMock(
+        spec_set=[
+            "flow",
+            "async_update_entry",
+            "async_forward_entry_setups",
+            "async_unload_platforms",
+        ]
+    )
+    hass.config_entries.flow = MagicMock(spec_set=["async_init", "async_configure"])
     return hass
 
 
@@ -1,8 +1,13 @@
 """Tests for Omo Lavanderia API client."""
+import asyncio
+import json
+from unittest.mock import AsyncMock
+
 import pytest
 import time
 
 from custom_components.omo_lavanderia.api.client import OmoLavanderiaApiClient
+from custom_components.omo_lavanderia.const import MAX_CONCURRENT_REQUESTS
 from custom_components.omo_lavanderia.api.exceptions import (
     OmoAuthError,
     OmoApiError,
@@ -12,10 +17,17 @@ from custom_components.omo_lavanderia.api.exceptions import (
 class MockResponse:
     """Mock aiohttp response."""
     
-    def __init__(self, status: int, json_data: dict = None, text_data: str = None):
+    def __init__(
+        self,
+        status: int,
+        json_data: dict = None,
+        text_data: str = None,
+        headers: dict = None,
+    ):
         self.status = status
         self._json_data = json_data or {}
         self._text_data = text_data or ""
+        self.headers = headers or {}
     
     async def json(self):
         return self._json_data
@@ -41,6 +53,10 @@ class MockSession:
     """Mock aiohttp ClientSession."""
     
     def __init__(self):
+        self.reset()
+    
+    def reset(self):
+        """Clear canned responses and recorded calls."""
         self.post_response = None
         self.request_response = None
         self.post_calls = []
@@ -55,12 +71,73 @@ class MockSession:
         return MockContextManager(self.request_response)
 
 
-@pytest.fixture
+class BlockingSession:
+    """Mock aiohttp ClientSession whose requests wait until released.
+
+    Requests sent with the expired access token get HTTP 401.
+    """
+
+    def __init__(self, response: MockResponse, expired_token: str = None):
+        self.response = response
+        self.expired_token = expired_token
+        self.release = asyncio.Event()
+        self.active = 0
+        self.max_active = 0
+        self.calls = 0
+
+    def request(self, method, url, **kwargs):
+        if kwargs["headers"].get("Authorization") == f"Bearer {self.expired_token}":
+            return BlockingContextManager(
+                self, MockResponse(status=401, text_data="Unauthorized")
+            )
+        return BlockingContextManager(self, self.response)
+
+
+class BlockingContextManager:
+    """Mock request context counting the requests in flight."""
+
+    def __init__(self, session: BlockingSession, response: MockResponse):
+        self.session = session
+        self.response = response
+
+    async def __aenter__(self):
+        session = self.session
+        session.active += 1
+        session.max_active = max(session.max_active, session.active)
+        session.calls += 1
+        await session.release.wait()
+        return self.response
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.session.active -= 1
+
+
+@pytest.fixture(scope="module")
 def mock_session():
-    """Create a mock aiohttp session."""
+    """Create a mock aiohttp session shared by the module."""
     return MockSession()
 
 
+@pytest.fixture(autouse=True)
+def reset_mock_session(mock_session):
+    """Reset the shared session before each test."""
+    mock_session.reset()
+
+
+@pytest.fixture
+def make_response():
+    """Return a factory for JSON responses whose text matches their body."""
+    def _make_response(data, status: int = 200, headers: dict = None) -> MockResponse:
+        return MockResponse(
+            status=status,
+            json_data=data,
+            text_data=json.dumps(data),
+            headers=headers,
+        )
+
+    return _make_response
+
+
 @pytest.fixture
 def client(mock_session):
     """Create a client instance."""
@@ -71,11 +148,10 @@ class TestOmoLavanderiaApiClient:
     """Tests for OmoLavanderiaApiClient."""
 
     @pytest.mark.asyncio
-    async def test_login_success(self, client, mock_session):
+    async def test_login_success(self, client, mock_session, make_response):
         """Test successful login."""
-        mock_session.post_response = MockResponse(
-            status=200,
-            json_data={
+        mock_session.post_response = make_response(
+            {
                 "data": {
                     "accessToken": "access_token_123",
                     "refreshToken": "refresh_token_456",
@@ -103,14 +179,12 @@ class TestOmoLavanderiaApiClient:
             await client.async_login()
 
     @pytest.mark.asyncio
-    async def test_get_laundries(self, client, mock_session):
+    async def test_get_laundries(self, client, mock_session, make_response):
         """Test getting laundries."""
         client.set_tokens("access", "refresh", int(time.time()) + 3600)
 
-        mock_session.request_response = MockResponse(
-            status=200,
-            text_data='{"data": {"items": []}}',
-            json_data={
+        mock_session.request_response = make_response(
+            {
                 "data": {
                     "items": [
                         {
@@ -133,14 +207,12 @@ class TestOmoLavanderiaApiClient:
         assert laundries[0].name == "Test Laundry"
 
     @pytest.mark.asyncio
-    async def test_get_laundry_details(self, client, mock_session):
+    async def test_get_laundry_details(self, client, mock_session, make_response):
         """Test getting laundry details."""
         client.set_tokens("access", "refresh", int(time.time()) + 3600)
 
-        mock_session.request_response = MockResponse(
-            status=200,
-            text_data='{"data": {}}',
-            json_data={
+        mock_session.request_response = make_response(
+            {
                 "data": {
                     "id": "laundry-123",
                     "name": "Test Laundry",
@@ -176,14 +248,12 @@ class TestOmoLavanderiaApiClient:
         assert laundry.washers[0].display_name == "L1"
 
     @pytest.mark.asyncio
-    async def test_get_active_orders(self, client, mock_session):
+    async def test_get_active_orders(self, client, mock_session, make_response):
         """Test getting active orders."""
         client.set_tokens("access", "refresh", int(time.time()) + 3600)
 
-        mock_session.request_response = MockResponse(
-            status=200,
-            text_data='{"data": []}',
-            json_data={
+        mock_session.request_response = make_response(
+            {
                 "data": [
                     {
                         "id": "order-123",
@@ -213,14 +283,94 @@ class TestOmoLavanderiaApiClient:
         assert orders[0].machines[0].remaining_time == 600
 
     @pytest.mark.asyncio
-    async def test_get_payment_cards(self, client, mock_session):
-        """Test getting payment cards."""
+    async def test_get_laundry_not_modified(self, client, mock_session, make_response):
+        """Test laundry details are reused when the server answers 304."""
+        client.set_tokens("access", "refresh", int(time.time()) + 3600)
+
+        mock_session.request_response = make_response(
+            {"data": {"id": "laundry-123", "machines": {}}},
+            headers={"ETag": '"v1"', "Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT"},
+        )
+        first = await client.async_get_laundry("laundry-123")
+
+        mock_session.request_response = MockResponse(status=304)
+        second = await client.async_get_laundry("laundry-123")
+
+        assert second is first
+        first_headers = mock_session.request_calls[0][2]["headers"]
+        second_headers = mock_session.request_calls[1][2]["headers"]
+        assert "If-None-Match" not in first_headers
+        assert second_headers["If-None-Match"] == '"v1"'
+        assert second_headers["If-Modified-Since"] == "Wed, 01 Jan 2025 00:00:00 GMT"
+
+    @pytest.mark.asyncio
+    async def test_request_invalid_json(self, client, mock_session):
+        """Test a non-JSON body raises OmoApiError."""
         client.set_tokens("access", "refresh", int(time.time()) + 3600)
 
         mock_session.request_response = MockResponse(
             status=200,
-            text_data='{"data": []}',
-            json_data={
+            text_data="<html>Proxy warning</html>",
+        )
+
+        with pytest.raises(OmoApiError, match="Invalid JSON response"):
+            await client.async_get_payment_cards()
+
+    @pytest.mark.asyncio
+    async def test_get_laundry_parse_failure_drops_validators(
+        self, client, mock_session, make_response
+    ):
+        """Test a body that fails to parse is not later confirmed by a 304."""
+        client.set_tokens("access", "refresh", int(time.time()) + 3600)
+
+        mock_session.request_response = make_response(
+            {"data": {"id": "laundry-123", "machines": {}}},
+            headers={"ETag": '"v1"'},
+        )
+        await client.async_get_laundry("laundry-123")
+
+        mock_session.request_response = make_response(
+            {"data": {"id": "laundry-123", "machines": {"washers": [{"type": "UNKNOWN"}]}}},
+            headers={"ETag": '"v2"'},
+        )
+        with pytest.raises(KeyError):
+            await client.async_get_laundry("laundry-123")
+
+        mock_session.request_response = make_response(
+            {"data": {"id": "laundry-123", "name": "Updated", "machines": {}}},
+            headers={"ETag": '"v3"'},
+        )
+        laundry = await client.async_get_laundry("laundry-123")
+
+        assert laundry.name == "Updated"
+        assert "If-None-Match" not in mock_session.request_calls[2][2]["headers"]
+
+    @pytest.mark.asyncio
+    async def test_get_active_orders_bundle_not_modified(
+        self, client, mock_session, make_response
+    ):
+        """Test active orders bundle is reused when the server answers 304."""
+        client.set_tokens("access", "refresh", int(time.time()) + 3600)
+
+        mock_session.request_response = make_response(
+            {"data": []},
+            headers={"ETag": '"orders-v1"'},
+        )
+        first = await client.async_get_active_orders_bundle()
+
+        mock_session.request_response = MockResponse(status=304)
+        second = await client.async_get_active_orders_bundle()
+
+        assert second is first
+        assert mock_session.request_calls[1][2]["headers"]["If-None-Match"] == '"orders-v1"'
+
+    @pytest.mark.asyncio
+    async def test_get_payment_cards(self, client, mock_session, make_response):
+        """Test getting payment cards."""
+        client.set_tokens("access", "refresh", int(time.time()) + 3600)
+
+        mock_session.request_response = make_response(
+            {
                 "data": [
                     {
                         "id": "card-123",
@@ -240,19 +390,68 @@ class TestOmoLavanderiaApiClient:
         assert cards[0].nickname == "My Card"
         assert cards[0].brand == "visa"
 
-    def test_is_token_expired_no_token(self, client):
-        """Test token expiration check when no token is set."""
-        assert client.is_token_expired() is True
+    @pytest.mark.asyncio
+    async def test_requests_limited_to_max_concurrent(self, make_response):
+        """Test requests beyond MAX_CONCURRENT_REQUESTS wait for a free slot."""
+        session = BlockingSession(make_response({"data": []}))
+        client = OmoLavanderiaApiClient(session, "test@email.com", "password123")
+        client.set_tokens("access", "refresh", int(time.time()) + 3600)
 
-    def test_is_token_expired_with_valid_token(self, client):
-        """Test token expiration check with valid token."""
+        tasks = [
+            asyncio.create_task(client.async_get_payment_cards())
+            for _ in range(MAX_CONCURRENT_REQUESTS + 2)
+        ]
+        for _ in range(10):
+            await asyncio.sleep(0)
+        assert session.active == MAX_CONCURRENT_REQUESTS
+
+        session.release.set()
+        await asyncio.wait_for(asyncio.gather(*tasks), timeout=1)
+
+        assert session.max_active == MAX_CONCURRENT_REQUESTS
+        assert session.calls == MAX_CONCURRENT_REQUESTS + 2
+
+    @pytest.mark.asyncio
+    async def test_401_retry_with_all_slots_busy(self, make_response):
+        """Test 401 retries do not wait on slots held by the failing requests."""
+        session = BlockingSession(make_response({"data": []}), expired_token="access")
+        client = OmoLavanderiaApiClient(session, "test@email.com", "password123")
         client.set_tokens("access", "refresh", int(time.time()) + 3600)
-        assert client.is_token_expired() is False
 
-    def test_is_token_expired_with_expired_token(self, client):
-        """Test token expiration check with expired token."""
-        client.set_tokens("access", "refresh", 1000000000)
-        assert client.is_token_expired() is True
+        async def _login() -> bool:
+            client.set_tokens("new_access", "new_refresh", int(time.time()) + 3600)
+            return True
+
+        client.async_ensure_valid_token = AsyncMock(side_effect=_login)
+
+        tasks = [
+            asyncio.create_task(client.async_get_payment_cards())
+            for _ in range(MAX_CONCURRENT_REQUESTS)
+        ]
+        for _ in range(10):
+            await asyncio.sleep(0)
+        assert session.active == MAX_CONCURRENT_REQUESTS
+
+        session.release.set()
+        results = await asyncio.wait_for(asyncio.gather(*tasks), timeout=1)
+
+        assert results == [[]] * MAX_CONCURRENT_REQUESTS
+        assert session.calls == MAX_CONCURRENT_REQUESTS * 2
+        assert client.async_ensure_valid_token.await_count == MAX_CONCURRENT_REQUESTS
+
+    @pytest.mark.parametrize(
+        ("expires_at", "expected"),
+        [
+            (None, True),  # no token set
+            (9999999999, False),  # valid token
+            (1000000000, True),  # expired token
+        ],
+    )
+    def test_is_token_expired(self, client, expires_at, expected):
+        """Test token expiration check."""
+        if expires_at is not None:
+            client.set_tokens("access", "refresh", expires_at)
+        assert client.is_token_expired() is expected
 
     def test_set_tokens(self, client):
         """Test setting tokens."""
@@ -1,16 +1,24 @@
 """Tests for Omo Lavanderia coordinator."""
-from unittest.mock import AsyncMock, MagicMock
+from datetime import timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from custom_components.omo_lavanderia.api.models import (
     ActiveOrder,
     ActiveOrderMachine,
+    ActiveOrdersBundle,
     Laundry,
     LaundryMachine,
     MachineStatus,
     MachineType,
 )
+from custom_components.omo_lavanderia.const import (
+    DEFAULT_SCAN_INTERVAL,
+    IDLE_SCAN_INTERVAL,
+    MAX_SCAN_INTERVAL,
+)
 from custom_components.omo_lavanderia.coordinator import (
     MachineState,
     OmoLavanderiaCoordinator,
@@ -24,6 +32,9 @@ def mock_client():
     client = MagicMock()
     client.async_get_laundry = AsyncMock()
     client.async_get_active_orders = AsyncMock(return_value=[])
+    client.async_get_active_orders_bundle = AsyncMock(
+        return_value=ActiveOrdersBundle()
+    )
     client.is_token_expired = MagicMock(return_value=False)
     client.async_ensure_valid_token = AsyncMock(return_value=True)
     client.get_token_status = MagicMock(return_value={
@@ -56,10 +67,9 @@ class TestMachineState:
     def test_machine_state_available(self):
         """Test available machine state."""
         mock_machine = MagicMock(spec=LaundryMachine)
+        mock_machine.status = MachineStatus.AVAILABLE
         state = MachineState(
             machine=mock_machine,
-            is_available=True,
-            is_in_use_by_me=False,
             is_running=False,
             remaining_time_seconds=None,
         )
@@ -72,10 +82,9 @@ class TestMachineState:
     def test_machine_state_in_use_by_me(self):
         """Test machine in use by current user."""
         mock_machine = MagicMock(spec=LaundryMachine)
+        mock_machine.status = MachineStatus.IN_USE
         state = MachineState(
             machine=mock_machine,
-            is_available=False,
-            is_in_use_by_me=True,
             is_running=True,
             remaining_time_seconds=600,
             order_id="order-123",
@@ -89,14 +98,166 @@ class TestMachineState:
         assert state.order_id == "order-123"
         assert state.usage_status == "IN_USE"
 
+    def test_machine_state_order_complete(self):
+        """Test machine with a completed order is no longer in use by me."""
+        mock_machine = MagicMock(spec=LaundryMachine)
+        mock_machine.status = MachineStatus.IN_USE
+        state = MachineState(
+            machine=mock_machine,
+            order_id="order-123",
+            usage_status="COMPLETE",
+        )
+
+        assert state.is_available is False
+        assert state.is_in_use_by_me is False
+
 
 class TestOmoLavanderiaCoordinator:
     """Tests for OmoLavanderiaCoordinator.
     
-    Note: Full coordinator tests require Home Assistant frame helper setup.
-    These tests are skipped in unit tests and run in integration tests.
+    _build_data is driven through a stub exposing only the state it uses,
+    polls go through a coordinator on the mock client.
     """
-    pass
+
+    @staticmethod
+    def _laundry() -> Laundry:
+        """Build a laundry with one machine in each relevant status."""
+        return Laundry.from_detail({
+            "id": "laundry-123",
+            "machines": {
+                "washers": [
+                    {"id": "washer-1", "displayName": "L1", "type": "WASHER", "status": "AVAILABLE"},
+                    {"id": "washer-2", "displayName": "L2", "type": "WASHER", "status": "IN_USE"},
+                ],
+                "dryers": [
+                    {"id": "dryer-1", "displayName": "S1", "type": "DRYER", "status": "OFFLINE"},
+                ],
+            },
+        })
+
+    @staticmethod
+    def _build(laundry: Laundry, orders: list[dict]) -> OmoLavanderiaData:
+        """Run _build_data on a fresh stub coordinator."""
+        stub = SimpleNamespace(laundry_id="laundry-123", _machine_states={})
+        return OmoLavanderiaCoordinator._build_data(
+            stub, laundry, ActiveOrdersBundle.from_list(orders)
+        )
+
+    @pytest.mark.parametrize(
+        ("in_use_by_me", "errors", "expected"),
+        [
+            (False, 0, IDLE_SCAN_INTERVAL),
+            (False, 1, IDLE_SCAN_INTERVAL * 2),
+            (False, 2, MAX_SCAN_INTERVAL),
+            (False, 3, MAX_SCAN_INTERVAL),
+            (False, 4, MAX_SCAN_INTERVAL),
+            (False, 5, MAX_SCAN_INTERVAL),
+            (True, 0, DEFAULT_SCAN_INTERVAL),
+            (True, 1, DEFAULT_SCAN_INTERVAL * 2),
+            (True, 2, DEFAULT_SCAN_INTERVAL * 4),
+            (True, 3, DEFAULT_SCAN_INTERVAL * 8),
+            (True, 4, DEFAULT_SCAN_INTERVAL * 16),
+            (True, 5, MAX_SCAN_INTERVAL),
+        ],
+    )
+    def test_adjust_update_interval(self, in_use_by_me, errors, expected):
+        """Test errors back off from the active or idle interval, never below it."""
+        data = OmoLavanderiaData(
+            machines_in_use_by_me=[MagicMock(spec=MachineState)] if in_use_by_me else []
+        )
+        stub = SimpleNamespace(_consecutive_errors=errors, update_interval=None)
+
+        OmoLavanderiaCoordinator._adjust_update_interval(stub, data)
+
+        assert stub.update_interval == timedelta(seconds=expected)
+
+    def test_adjust_update_interval_without_data(self):
+        """Test a coordinator without data polls at the idle interval."""
+        stub = SimpleNamespace(_consecutive_errors=0, update_interval=None)
+
+        OmoLavanderiaCoordinator._adjust_update_interval(stub, None)
+
+        assert stub.update_interval == timedelta(seconds=IDLE_SCAN_INTERVAL)
+
+    def test_build_data_paths_agree_without_my_machines(self):
+        """Test the no-order fast path and the order path build the same states."""
+        laundry = self._laundry()
+        # An order at this laundry for a machine that is not listed forces the
+        # order path without touching any of the listed machines
+        orders = [{
+            "id": "order-1",
+            "laundryId": "laundry-123",
+            "machines": [{"id": "om-1", "type": "WASHER", "displayName": "L9"}],
+        }]
+
+        fast = self._build(laundry, [])
+        ordered = self._build(laundry, orders)
+
+        assert fast.machines == ordered.machines
+        assert fast.machines_in_use_by_me == ordered.machines_in_use_by_me == []
+        assert {mid: s.status_label for mid, s in fast.machines.items()} == {
+            "washer-1": "available",
+            "washer-2": "in_use",
+            "dryer-1": "unavailable",
+        }
+
+    def test_build_data_machine_in_use_by_me(self):
+        """Test a machine held by one of my running orders."""
+        orders = [{
+            "id": "order-1",
+            "laundryId": "laundry-123",
+            "machines": [{
+                "id": "om-1",
+                "type": "WASHER",
+                "displayName": "L2",
+                "remainingTime": 600,
+                "usageStatus": "IN_USE",
+            }],
+        }]
+
+        data = self._build(self._laundry(), orders)
+
+        state = data.machines["washer-2"]
+        assert state.status_label == "in_use_by_me"
+        assert state.is_running is True
+        assert state.remaining_time_seconds == 600
+        assert state.order_id == "order-1"
+        assert data.machines_in_use_by_me == [state]
+
+    async def test_update_reuses_data_when_not_modified(self, coordinator, mock_client):
+        """Test a poll returning the cached laundry and orders skips the rebuild."""
+        mock_client.async_get_laundry.return_value = self._laundry()
+        mock_client.async_get_active_orders_bundle.return_value = ActiveOrdersBundle()
+
+        with patch.object(
+            coordinator, "_build_data", wraps=coordinator._build_data
+        ) as build_data:
+            coordinator.data = await coordinator._async_update_data()
+            first = coordinator.data
+            coordinator.data = await coordinator._async_update_data()
+
+        assert build_data.call_count == 1
+        assert coordinator.data is first
+
+    async def test_update_rebuilds_data_when_laundry_changes(
+        self, coordinator, mock_client
+    ):
+        """Test a new laundry instance rebuilds the data even with cached orders."""
+        mock_client.async_get_laundry.return_value = self._laundry()
+        mock_client.async_get_active_orders_bundle.return_value = ActiveOrdersBundle()
+
+        with patch.object(
+            coordinator, "_build_data", wraps=coordinator._build_data
+        ) as build_data:
+            coordinator.data = await coordinator._async_update_data()
+            first = coordinator.data
+            laundry = self._laundry()
+            mock_client.async_get_laundry.return_value = laundry
+            coordinator.data = await coordinator._async_update_data()
+
+        assert build_data.call_count == 2
+        assert coordinator.data is not first
+        assert coordinator.data.laundry is laundry
 
 
 class TestOmoLavanderiaData:
@@ -109,16 +270,14 @@ class TestOmoLavanderiaData:
         assert data.laundry is None
         assert data.active_orders == []
         assert data.machines == {}
+        assert data.machines_in_use_by_me == []
 
     def test_data_with_values(self):
         """Test OmoLavanderiaData with values."""
         mock_laundry = MagicMock(spec=Laundry)
         mock_order = MagicMock(spec=ActiveOrder)
         mock_machine = MagicMock(spec=LaundryMachine)
-        mock_state = MachineState(
-            machine=mock_machine,
-            is_available=True,
-        )
+        mock_state = MachineState(machine=mock_machine)
         
         data = OmoLavanderiaData(
             laundry=mock_laundry,
@@ -1,71 +1,141 @@
 """Tests for Omo Lavanderia API models."""
+from types import MappingProxyType
+
 import pytest
 
 from custom_components.omo_lavanderia.api.models import (
     ActiveOrder,
     ActiveOrderMachine,
+    ActiveOrdersBundle,
     Laundry,
+    LaundryAddress,
     LaundryMachine,
+    MachinePrice,
     MachineStatus,
     MachineType,
+    MachineUnavailable,
     PaymentCard,
 )
 
+# Shared API payloads, read-only so no test can alter them for the others
+WASHER_DATA = MappingProxyType({
+    "id": "6fd27ed3-231e-4f07-9e34-0dcf3dfe3f21",
+    "code": "mac_2a6931",
+    "displayName": "L1",
+    "laundryId": "d944decd-ef93-440e-afd3-0d7212bc1eb4",
+    "type": "WASHER",
+    "serial": "2310030869",
+    "model": "STENXASP543DW01",
+    "cycleTime": 30,
+    "status": "AVAILABLE",
+    "price": {"price": 10.28, "service": "43d76629-8f5e-4118-bb0a-49dfcac39de4"},
+    "unavailable": None,
+})
+
+DRYER_IN_USE_DATA = MappingProxyType({
+    "id": "bb72763a-9fa7-4103-aef7-37c7627e5741",
+    "code": "mac_1d107e",
+    "displayName": "S1",
+    "laundryId": "d944decd-ef93-440e-afd3-0d7212bc1eb4",
+    "type": "DRYER",
+    "serial": "2310030869",
+    "model": "STENXASP543DW01",
+    "cycleTime": 45,
+    "status": "IN_USE",
+    "price": {"price": 10.28, "service": "34eba87f-8026-4fe5-908e-e647d7e0ba02"},
+    "unavailable": {"reason": "IN_USE", "timeLeft": 11},
+})
+
+ACTIVE_ORDERS_DATA = (
+    MappingProxyType({
+        "id": "5cd55c33-0afe-4c21-95d3-6aaa585f86ab",
+        "laundryId": "d944decd-ef93-440e-afd3-0d7212bc1eb4",
+        "laundryName": "536555243 - CONDOMINIO ALTANO LAGO DOS PATOS",
+        "totalPrice": 10.28,
+        "status": "IN_PROGRESS",
+        "machines": [
+            {
+                "id": "0e25b055-112a-4246-b085-23f5f2ac9234",
+                "type": "DRYER",
+                "status": "IN_PROGRESS",
+                "remainingTime": 619,
+                "usageStatus": "IN_USE",
+                "displayName": "S1",
+            }
+        ],
+    }),
+)
+
+PAYMENT_CARD_DATA = MappingProxyType({
+    "id": "2fce3889-2aea-45af-9bba-34f294cef0f8",
+    "nickname": "Porto Gilson",
+    "holderName": "Gilson F B Souza",
+    "lastFour": "8218",
+    "brand": "visa",
+})
+
+
+# Models expected from the payloads above
+WASHER = LaundryMachine(
+    id="6fd27ed3-231e-4f07-9e34-0dcf3dfe3f21",
+    code="mac_2a6931",
+    display_name="L1",
+    laundry_id="d944decd-ef93-440e-afd3-0d7212bc1eb4",
+    machine_type=MachineType.WASHER,
+    serial="2310030869",
+    model="STENXASP543DW01",
+    cycle_time=30,
+    status=MachineStatus.AVAILABLE,
+    price=MachinePrice(price=10.28, service_id="43d76629-8f5e-4118-bb0a-49dfcac39de4"),
+    unavailable=None,
+)
+
+DRYER_IN_USE = LaundryMachine(
+    id="bb72763a-9fa7-4103-aef7-37c7627e5741",
+    code="mac_1d107e",
+    display_name="S1",
+    laundry_id="d944decd-ef93-440e-afd3-0d7212bc1eb4",
+    machine_type=MachineType.DRYER,
+    serial="2310030869",
+    model="STENXASP543DW01",
+    cycle_time=45,
+    status=MachineStatus.IN_USE,
+    price=MachinePrice(price=10.28, service_id="34eba87f-8026-4fe5-908e-e647d7e0ba02"),
+    unavailable=MachineUnavailable(reason="IN_USE", time_left=11),
+)
+
 
 class TestLaundryMachine:
     """Tests for LaundryMachine model."""
 
-    def test_from_dict_washer(self):
-        """Test creating washer from API response."""
-        data = {
-            "id": "6fd27ed3-231e-4f07-9e34-0dcf3dfe3f21",
-            "code": "mac_2a6931",
-            "displayName": "L1",
-            "laundryId": "d944decd-ef93-440e-afd3-0d7212bc1eb4",
-            "type": "WASHER",
-            "serial": "2310030869",
-            "model": "STENXASP543DW01",
-            "cycleTime": 30,
-            "status": "AVAILABLE",
-            "price": {"price": 10.28, "service": "43d76629-8f5e-4118-bb0a-49dfcac39de4"},
-            "unavailable": None,
-        }
+    @pytest.mark.parametrize(
+        ("data", "expected"),
+        [(WASHER_DATA, WASHER), (DRYER_IN_USE_DATA, DRYER_IN_USE)],
+        ids=["washer", "dryer_in_use"],
+    )
+    def test_from_dict(self, data, expected):
+        """Test creating machines from API response."""
+        assert LaundryMachine.from_dict(data) == expected
 
-        machine = LaundryMachine.from_dict(data)
+    def test_from_dict_unknown_status(self):
+        """Test unknown machine status falls back to UNAVAILABLE."""
+        machine = LaundryMachine.from_dict({"type": "WASHER", "status": "BROKEN"})
 
-        assert machine.id == "6fd27ed3-231e-4f07-9e34-0dcf3dfe3f21"
-        assert machine.display_name == "L1"
-        assert machine.machine_type == MachineType.WASHER
-        assert machine.status == MachineStatus.AVAILABLE
-        assert machine.cycle_time == 30
-        assert machine.price.price == 10.28
-        assert machine.unavailable is None
+        assert machine.status is MachineStatus.UNAVAILABLE
 
-    def test_from_dict_dryer_in_use(self):
-        """Test creating dryer in use from API response."""
-        data = {
-            "id": "bb72763a-9fa7-4103-aef7-37c7627e5741",
-            "code": "mac_1d107e",
-            "displayName": "S1",
-            "laundryId": "d944decd-ef93-440e-afd3-0d7212bc1eb4",
-            "type": "DRYER",
-            "serial": "2310030869",
-            "model": "STENXASP543DW01",
-            "cycleTime": 45,
-            "status": "IN_USE",
-            "price": {"price": 10.28, "service": "34eba87f-8026-4fe5-908e-e647d7e0ba02"},
-            "unavailable": {"reason": "IN_USE", "timeLeft": 11},
-        }
+    def test_from_dict_via_orjson(self):
+        """Test machines parse from orjson-decoded payloads like the client's."""
+        orjson = pytest.importorskip("orjson")
+        data = orjson.loads(orjson.dumps(dict(DRYER_IN_USE_DATA)))
 
-        machine = LaundryMachine.from_dict(data)
+        assert LaundryMachine.from_dict(data) == DRYER_IN_USE
 
-        assert machine.display_name == "S1"
-        assert machine.machine_type == MachineType.DRYER
-        assert machine.status == MachineStatus.IN_USE
-        assert machine.cycle_time == 45
-        assert machine.unavailable is not None
-        assert machine.unavailable.reason == "IN_USE"
-        assert machine.unavailable.time_left == 11
+    def test_enums_compare_as_strings(self):
+        """Test machine enums compare equal to their raw API values."""
+        machine = LaundryMachine.from_dict(DRYER_IN_USE_DATA)
+
+        assert machine.machine_type == "DRYER"
+        assert machine.status == "IN_USE"
 
 
 class TestLaundry:
@@ -82,13 +152,14 @@ class TestLaundry:
             "isBlocked": False,
         }
 
-        laundry = Laundry.from_list_item(data)
-
-        assert laundry.id == "d944decd-ef93-440e-afd3-0d7212bc1eb4"
-        assert laundry.name == "536555243 - CONDOMINIO ALTANO LAGO DOS PATOS"
-        assert laundry.laundry_type == "OLC"
-        assert laundry.is_closed is False
-        assert laundry.is_blocked is False
+        assert Laundry.from_list_item(data) == Laundry(
+            id="d944decd-ef93-440e-afd3-0d7212bc1eb4",
+            name="536555243 - CONDOMINIO ALTANO LAGO DOS PATOS",
+            code="p85bid",
+            laundry_type="OLC",
+            is_closed=False,
+            is_blocked=False,
+        )
 
     def test_from_detail(self):
         """Test creating laundry from detail response."""
@@ -107,37 +178,28 @@ class TestLaundry:
                 "city": "GUARULHOS",
             },
             "machines": {
-                "washers": [
-                    {
-                        "id": "6fd27ed3-231e-4f07-9e34-0dcf3dfe3f21",
-                        "displayName": "L1",
-                        "type": "WASHER",
-                        "status": "AVAILABLE",
-                        "cycleTime": 30,
-                    }
-                ],
-                "dryers": [
-                    {
-                        "id": "bb72763a-9fa7-4103-aef7-37c7627e5741",
-                        "displayName": "S1",
-                        "type": "DRYER",
-                        "status": "IN_USE",
-                        "cycleTime": 45,
-                    }
-                ],
+                "washers": [WASHER_DATA],
+                "dryers": [DRYER_IN_USE_DATA],
             },
         }
 
-        laundry = Laundry.from_detail(data)
-
-        assert laundry.id == "d944decd-ef93-440e-afd3-0d7212bc1eb4"
-        assert laundry.payment_mode == "PREPAID"
-        assert len(laundry.washers) == 1
-        assert len(laundry.dryers) == 1
-        assert laundry.washers[0].display_name == "L1"
-        assert laundry.dryers[0].display_name == "S1"
-        assert laundry.address is not None
-        assert laundry.address.city == "GUARULHOS"
+        assert Laundry.from_detail(data) == Laundry(
+            id="d944decd-ef93-440e-afd3-0d7212bc1eb4",
+            name="536555243 - CONDOMINIO ALTANO LAGO DOS PATOS",
+            code="p85bid",
+            laundry_type="OLC",
+            is_closed=False,
+            is_blocked=False,
+            payment_mode="PREPAID",
+            address=LaundryAddress(
+                street="RUA RIO GRANDE",
+                number=375,
+                neighborhood="VILA ROSÁLIA",
+                city="GUARULHOS",
+            ),
+            washers=[WASHER],
+            dryers=[DRYER_IN_USE],
+        )
 
 
 class TestActiveOrder:
@@ -145,34 +207,66 @@ class TestActiveOrder:
 
     def test_from_dict(self):
         """Test creating active order from API response."""
-        data = {
-            "id": "5cd55c33-0afe-4c21-95d3-6aaa585f86ab",
-            "laundryId": "d944decd-ef93-440e-afd3-0d7212bc1eb4",
-            "laundryName": "536555243 - CONDOMINIO ALTANO LAGO DOS PATOS",
-            "totalPrice": 10.28,
-            "status": "IN_PROGRESS",
-            "machines": [
-                {
-                    "id": "0e25b055-112a-4246-b085-23f5f2ac9234",
-                    "type": "DRYER",
-                    "status": "IN_PROGRESS",
-                    "remainingTime": 619,
-                    "usageStatus": "IN_USE",
-                    "displayName": "S1",
-                }
+        assert ActiveOrder.from_dict(ACTIVE_ORDERS_DATA[0]) == ActiveOrder(
+            id="5cd55c33-0afe-4c21-95d3-6aaa585f86ab",
+            laundry_id="d944decd-ef93-440e-afd3-0d7212bc1eb4",
+            laundry_name="536555243 - CONDOMINIO ALTANO LAGO DOS PATOS",
+            total_price=10.28,
+            status="IN_PROGRESS",
+            machines=[
+                ActiveOrderMachine(
+                    id="0e25b055-112a-4246-b085-23f5f2ac9234",
+                    machine_type=MachineType.DRYER,
+                    status="IN_PROGRESS",
+                    remaining_time=619,
+                    usage_status="IN_USE",
+                    display_name="S1",
+                )
             ],
-        }
+        )
 
-        order = ActiveOrder.from_dict(data)
 
-        assert order.id == "5cd55c33-0afe-4c21-95d3-6aaa585f86ab"
-        assert order.laundry_id == "d944decd-ef93-440e-afd3-0d7212bc1eb4"
-        assert order.total_price == 10.28
-        assert order.status == "IN_PROGRESS"
-        assert len(order.machines) == 1
-        assert order.machines[0].display_name == "S1"
-        assert order.machines[0].remaining_time == 619
-        assert order.machines[0].machine_type == MachineType.DRYER
+class TestActiveOrdersBundle:
+    """Tests for ActiveOrdersBundle model."""
+
+    def test_from_list_indexes_machines_by_laundry(self):
+        """Test order machines are indexed by laundry and display name."""
+        data = [
+            {
+                "id": "order-1",
+                "laundryId": "laundry-1",
+                "machines": [
+                    {"id": "om-1", "type": "WASHER", "displayName": "L1", "remainingTime": 600},
+                    {"id": "om-2", "type": "DRYER", "displayName": "S1", "remainingTime": 0},
+                ],
+            },
+            {
+                "id": "order-2",
+                "laundryId": "laundry-2",
+                "machines": [
+                    {"id": "om-3", "type": "WASHER", "displayName": "L1"},
+                ],
+            },
+        ]
+
+        bundle = ActiveOrdersBundle.from_list(data)
+
+        assert [order.id for order in bundle.orders] == ["order-1", "order-2"]
+        assert bundle.orders_by_id["order-2"] is bundle.orders[1]
+        by_name = bundle.machines_for_laundry("laundry-1")
+        assert set(by_name) == {"L1", "S1"}
+        order_machine, order_id = by_name["L1"]
+        assert order_machine.remaining_time == 600
+        assert order_id == "order-1"
+        assert bundle.machines_for_laundry("laundry-2")["L1"][1] == "order-2"
+        assert bundle.machines_for_laundry("unknown") == {}
+
+    def test_empty(self):
+        """Test empty bundle has no orders or machines."""
+        bundle = ActiveOrdersBundle()
+
+        assert bundle.orders == []
+        assert bundle.machines_for_laundry("laundry-1") == {}
 
 
 class TestPaymentCard:
@@ -180,21 +274,13 @@ class TestPaymentCard:
 
     def test_from_dict(self):
         """Test creating payment card from API response."""
-        data = {
-            "id": "2fce3889-2aea-45af-9bba-34f294cef0f8",
-            "nickname": "Porto Gilson",
-            "holderName": "Gilson F B Souza",
-            "lastFour": "8218",
-            "brand": "visa",
-        }
-
-        card = PaymentCard.from_dict(data)
-
-        assert card.id == "2fce3889-2aea-45af-9bba-34f294cef0f8"
-        assert card.nickname == "Porto Gilson"
-        assert card.holder_name == "Gilson F B Souza"
-        assert card.last_four == "8218"
-        assert card.brand == "visa"
+        assert PaymentCard.from_dict(PAYMENT_CARD_DATA) == PaymentCard(
+            id="2fce3889-2aea-45af-9bba-34f294cef0f8",
+            nickname="Porto Gilson",
+            holder_name="Gilson F B Souza",
+            last_four="8218",
+            brand="visa",
+        )
 
     def test_display_name(self):
         """Test card display name property."""
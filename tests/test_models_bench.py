@@ -0,0 +1,64 @@
+"""Benchmarks for Omo Lavanderia API model parsing.
+
+Run with ``pytest -m bench``; they are excluded from the default run.
+"""
+import pytest
+
+from custom_components.omo_lavanderia.api.models import (
+    ActiveOrdersBundle,
+    Laundry,
+    LaundryMachine,
+    PaymentCard,
+)
+
+from .test_models import (
+    ACTIVE_ORDERS_DATA,
+    DRYER_IN_USE_DATA,
+    PAYMENT_CARD_DATA,
+    WASHER_DATA,
+)
+
+pytest.importorskip("pytest_benchmark")
+
+pytestmark = [pytest.mark.bench, pytest.mark.benchmark(group="from_dict")]
+
+# A laundry the size of a typical building, as returned by the detail endpoint
+LAUNDRY_DETAIL_DATA = {
+    "id": "d944decd-ef93-440e-afd3-0d7212bc1eb4",
+    "name": "536555243 - CONDOMINIO ALTANO LAGO DOS PATOS",
+    "code": "p85bid",
+    "type": "OLC",
+    "paymentMode": "PREPAID",
+    "isClosed": False,
+    "isBlocked": False,
+    "laundryAddress": {
+        "street": "RUA RIO GRANDE",
+        "number": 375,
+        "neighborhood": "VILA ROSÁLIA",
+        "city": "GUARULHOS",
+    },
+    "machines": {
+        "washers": [WASHER_DATA] * 4,
+        "dryers": [DRYER_IN_USE_DATA] * 4,
+    },
+}
+
+
+def test_laundry_machine_from_dict(benchmark):
+    """Benchmark parsing a single machine."""
+    benchmark(LaundryMachine.from_dict, WASHER_DATA)
+
+
+def test_laundry_from_detail(benchmark):
+    """Benchmark parsing a laundry with its machines."""
+    benchmark(Laundry.from_detail, LAUNDRY_DETAIL_DATA)
+
+
+def test_active_orders_bundle_from_list(benchmark):
+    """Benchmark parsing and indexing active orders."""
+    benchmark(ActiveOrdersBundle.from_list, ACTIVE_ORDERS_DATA)
+
+
+def test_payment_card_from_dict(benchmark):
+    """Benchmark parsing a payment card."""
+    benchmark(PaymentCard.from_dict, PAYMENT_CARD_DATA)
@@ -0,0 +1,103 @@
+"""Tests for Omo Lavanderia sensors."""
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from custom_components.omo_lavanderia.api.models import LaundryMachine, MachineType
+from custom_components.omo_lavanderia.const import DOMAIN
+from custom_components.omo_lavanderia.coordinator import MachineState
+from custom_components.omo_lavanderia.sensor import (
+    OmoDiagnosticSensor,
+    OmoRemainingTimeSensor,
+    async_setup_entry,
+)
+
+ER_PATH = "custom_components.omo_lavanderia.sensor.er"
+
+
+class TestOmoRemainingTimeSensor:
+    """Tests for OmoRemainingTimeSensor."""
+
+    def test_writes_state_once_when_cycle_ends(self):
+        """Test the end of a cycle is written once, not again on the next poll."""
+        machine = MagicMock(spec=LaundryMachine)
+        machine.machine_type = MachineType.WASHER
+        running = MachineState(machine=machine, is_running=True, remaining_time_seconds=600)
+        finished = MachineState(machine=machine)
+
+        coordinator = MagicMock()
+        coordinator.data = None
+        coordinator.last_update_success = True
+        coordinator.get_machine_state.return_value = running
+        sensor = OmoRemainingTimeSensor(coordinator, "machine-1")
+        assert sensor.available is True
+
+        coordinator.get_machine_state.return_value = finished
+        with patch.object(sensor, "async_write_ha_state") as write_state:
+            sensor._handle_coordinator_update()
+            sensor._handle_coordinator_update()
+
+        assert write_state.call_count == 1
+        assert sensor.native_value is None
+        assert sensor.available is False
+
+
+class TestAsyncSetupEntry:
+    """Tests for the sensor platform setup."""
+
+    async def test_removes_old_diagnostic_entries(self, hass, config_entry):
+        """Test only the old per-machine diagnostic entries are removed."""
+        machine = MagicMock(spec=LaundryMachine)
+        machine.machine_type = MachineType.WASHER
+        state = MachineState(machine=machine)
+
+        coordinator = MagicMock()
+        coordinator.laundry_id = "laundry-123"
+        coordinator.data.machines = {"machine-1": state}
+        coordinator.get_machine_state.return_value = state
+        hass.data = {DOMAIN: {config_entry.entry_id: coordinator}}
+
+        registry_entries = [
+            SimpleNamespace(
+                domain="sensor",
+                unique_id="machine-1_diagnostic",
+                entity_id="sensor.washer_1_diagnostic",
+            ),
+            SimpleNamespace(
+                domain="sensor",
+                unique_id="machine-2_diagnostic",
+                entity_id="sensor.washer_2_diagnostic",
+            ),
+            SimpleNamespace(
+                domain="sensor",
+                unique_id="machine-1_status",
+                entity_id="sensor.washer_1_status",
+            ),
+            SimpleNamespace(
+                domain="sensor",
+                unique_id="laundry-123_diagnostic",
+                entity_id="sensor.test_laundry_diagnostic",
+            ),
+        ]
+        entity_registry = MagicMock()
+        async_add_entities = MagicMock()
+
+        with (
+            patch(f"{ER_PATH}.async_get", return_value=entity_registry),
+            patch(
+                f"{ER_PATH}.async_entries_for_config_entry",
+                return_value=registry_entries,
+            ),
+        ):
+            await async_setup_entry(hass, config_entry, async_add_entities)
+
+        assert [
+            call.args for call in entity_registry.async_remove.call_args_list
+        ] == [("sensor.washer_1_diagnostic",), ("sensor.washer_2_diagnostic",)]
+
+        entities = list(async_add_entities.call_args.args[0])
+        diagnostics = [
+            entity for entity in entities if isinstance(entity, OmoDiagnosticSensor)
+        ]
+        assert len(entities) == 5
+        assert len(diagnostics) == 1
+        assert diagnostics[0].unique_id == "laundry-123_diagnostic"